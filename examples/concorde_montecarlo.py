@@ -137,7 +137,7 @@ def main():
         InternalBallisticsCoupled,
     )
 
-    montecarlo_sim.run()
+    montecarlo_sim.run(properties=["total_impulse", "apogee"])
     montecarlo_sim.plot_histogram(0, "total_impulse", "Total Impulse (N.s)")
     montecarlo_sim.plot_histogram(1, "apogee", "Apogee (m)")
 
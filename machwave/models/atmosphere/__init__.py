@@ -8,7 +8,13 @@ from abc import ABC, abstractmethod
 
 
 class Atmosphere(ABC):
-    """Abstract class that represents an atmospheric model."""
+    """
+    Abstract class that represents an atmospheric model.
+
+    The getters of thermodynamic properties should accept both a single
+    altitude and a numpy array of altitudes, so that a whole trajectory can
+    be evaluated in one call.
+    """
 
     @abstractmethod
     def get_density(self, y_amsl: float) -> float:
@@ -2,29 +2,178 @@
 Implementation of the 1976 Standard Atmosphere model.
 """
 
+import functools
+
 from fluids.atmosphere import ATMOSPHERE_1976
 import numpy as np
 
 from machwave.models.atmosphere import Atmosphere
 
 
+@functools.lru_cache(maxsize=4)
+def _tabulate_atmosphere_1976(
+    min_altitude: float, max_altitude: float, resolution: float
+) -> dict[str, np.ndarray]:
+    """
+    Tabulates the properties of the 1976 Standard Atmosphere. The tables are
+    built once per process and shared, read-only, by every Atmosphere1976
+    instance.
+
+    Args:
+        min_altitude (float): Lowest tabulated altitude in meters.
+        max_altitude (float): Highest tabulated altitude in meters.
+        resolution (float): Altitude step in meters.
+
+    Returns:
+        dict[str, np.ndarray]: Tables of altitude and of every property,
+            keyed by their ATMOSPHERE_1976 attribute names.
+    """
+    altitude = np.arange(min_altitude, max_altitude + resolution, resolution)
+    atmospheres = [ATMOSPHERE_1976(y) for y in altitude]
+
+    tables = {"altitude": altitude}
+    for attribute in ("rho", "P", "v_sonic", "mu"):
+        tables[attribute] = np.array(
+            [getattr(atm, attribute) for atm in atmospheres]
+        )
+
+    for table in tables.values():
+        table.flags.writeable = False
+
+    return tables
+
+
+@functools.lru_cache(maxsize=4)
+def _get_scalar_tables_1976(
+    min_altitude: float, max_altitude: float, resolution: float
+) -> dict[str, tuple[list[float], list[float], list[float]]]:
+    """
+    Converts the tables of the 1976 Standard Atmosphere to Python lists,
+    along with the slope of every interval, so that scalar altitudes can be
+    interpolated with plain float arithmetic. Calling np.interp on a single
+    value costs several times more than the interpolation itself.
+
+    Args:
+        min_altitude (float): Lowest tabulated altitude in meters.
+        max_altitude (float): Highest tabulated altitude in meters.
+        resolution (float): Altitude step in meters.
+
+    Returns:
+        dict[str, tuple[list[float], list[float], list[float]]]: Altitudes,
+            values and slopes of every property, keyed by their
+            ATMOSPHERE_1976 attribute names.
+    """
+    tables = _tabulate_atmosphere_1976(min_altitude, max_altitude, resolution)
+    altitude = tables["altitude"]
+
+    scalar_tables = {}
+    for attribute, table in tables.items():
+        if attribute == "altitude":
+            continue
+
+        slopes = np.diff(table) / np.diff(altitude)
+        scalar_tables[attribute] = (
+            altitude.tolist(),
+            table.tolist(),
+            slopes.tolist(),
+        )
+
+    return scalar_tables
+
+
 class Atmosphere1976(Atmosphere):
     """
     Atmospheric model based on the 1976 Standard Atmosphere. This model uses
     the fluids library to calculate the properties of the atmosphere.
+
+    The properties are tabulated once per process and queried by linear
+    interpolation. Altitudes outside of the table are evaluated directly with
+    the fluids library. Every getter accepts a scalar or an array.
     """
 
+    # Tabulated altitude range and resolution (m):
+    min_table_altitude = -1e3
+    max_table_altitude = 100e3
+    table_resolution = 10
+
+    def get_tables(self) -> dict[str, np.ndarray]:
+        """
+        Returns the shared tables of the atmosphere properties. They are not
+        stored in the instance, so copying or pickling an atmosphere (e.g.
+        for every Monte Carlo scenario) does not copy them.
+
+        Returns:
+            dict[str, np.ndarray]: Tables of altitude and of every property,
+                keyed by their ATMOSPHERE_1976 attribute names.
+        """
+        return _tabulate_atmosphere_1976(
+            self.min_table_altitude,
+            self.max_table_altitude,
+            self.table_resolution,
+        )
+
+    def _lookup(
+        self, y_amsl: float | np.ndarray, attribute: str
+    ) -> float | np.ndarray:
+        """
+        Interpolates a tabulated property, falling back to the exact model
+        for altitudes outside of the table. Scalar altitudes are interpolated
+        in plain float arithmetic and arrays with np.interp.
+
+        Args:
+            y_amsl (float | np.ndarray): Altitude above mean sea level in
+                meters.
+            attribute (str): Name of the property in ATMOSPHERE_1976.
+
+        Returns:
+            float | np.ndarray: Value(s) of the property.
+        """
+        if not isinstance(y_amsl, (float, int)) and np.ndim(y_amsl) == 0:
+            y_amsl = float(y_amsl)
+
+        if isinstance(y_amsl, (float, int)):
+            if not (
+                self.min_table_altitude <= y_amsl <= self.max_table_altitude
+            ):
+                return getattr(ATMOSPHERE_1976(y_amsl), attribute)
+
+            altitudes, values, slopes = _get_scalar_tables_1976(
+                self.min_table_altitude,
+                self.max_table_altitude,
+                self.table_resolution,
+            )[attribute]
+
+            # The table is uniformly spaced, so the interval is found
+            # directly from the altitude:
+            index = int(
+                (y_amsl - self.min_table_altitude) / self.table_resolution
+            )
+            index = min(index, len(slopes) - 1)
+            return values[index] + slopes[index] * (y_amsl - altitudes[index])
+
+        tables = self.get_tables()
+        y_amsl = np.asarray(y_amsl, dtype=float)
+        values = np.interp(y_amsl, tables["altitude"], tables[attribute])
+
+        outside = (y_amsl < self.min_table_altitude) | (
+            y_amsl > self.max_table_altitude
+        )
+        values[outside] = [
+            getattr(ATMOSPHERE_1976(y), attribute) for y in y_amsl[outside]
+        ]
+        return values
+
     def get_density(self, y_amsl: float) -> float:
-        return ATMOSPHERE_1976(y_amsl).rho
+        return self._lookup(y_amsl, "rho")
 
     def get_gravity(self, y_amsl: float) -> float:
         return ATMOSPHERE_1976.gravity(y_amsl)
 
     def get_pressure(self, y_amsl: float) -> float:
-        return ATMOSPHERE_1976(y_amsl).P
+        return self._lookup(y_amsl, "P")
 
     def get_sonic_velocity(self, y_amsl: float) -> float:
-        return ATMOSPHERE_1976(y_amsl).v_sonic
+        return self._lookup(y_amsl, "v_sonic")
 
     def get_wind_velocity(self, y_amsl: float) -> tuple[float, float]:
         """
@@ -33,7 +182,7 @@ class Atmosphere1976(Atmosphere):
         return (7, 7)
 
     def get_viscosity(self, y_amsl: float) -> float:
-        return ATMOSPHERE_1976(y_amsl).mu
+        return self._lookup(y_amsl, "mu")
 
 
 class Atmosphere1976WindPowerLaw(Atmosphere1976):
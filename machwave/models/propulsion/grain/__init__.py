@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 import numpy as np
-from plotly import graph_objects as go
 
 from machwave.services.decorators import validate_assertions
 
@@ -19,6 +18,10 @@ class GrainSegment(ABC):
     Class that represents a grain segment.
     """
 
+    # Whether get_burn_area and get_port_area also accept an array of web
+    # distances, returning one value per web distance:
+    accepts_web_distance_arrays = False
+
     def __init__(
         self,
         length: float,
@@ -324,27 +327,38 @@ class Grain:
         burn_rate: np.ndarray,
         propellant_density: float,
         web_distance: np.ndarray,
+        dtype: np.dtype = np.float32,
     ) -> np.ndarray:
         """
         Returns a numpy multidimensional array with the mass flux for each
         grain.
-        """
-        segment_mass_flux = np.zeros(
-            (self.segment_count, np.size(web_distance))
-        )
-
-        for j in range(self.segment_count):  # iterating through each segment
-            for i in range(np.size(burn_rate)):
-                core_area = self.segments[j].get_port_area(web_distance[i])
-                burn_area = 0
-
-                for k in range(j + 1):
-                    burn_area = burn_area + self.segments[j - k].get_burn_area(
-                        web_distance[i]
-                    )
-
-                segment_mass_flux[j, i] = (
-                    burn_area * propellant_density * burn_rate[i]
-                ) / (core_area)
 
-        return segment_mass_flux
+        The geometry is evaluated at the given web distances in their own
+        precision. The areas, burn rate and resulting mass flux are stored as
+        contiguous arrays of 'dtype', single precision by default. Pass
+        np.float64 to keep double precision.
+        """
+        burn_rate = np.ascontiguousarray(burn_rate, dtype=dtype)
+        web_distance = np.asarray(web_distance)
+
+        burn_area = np.empty((self.segment_count, web_distance.size), dtype)
+        port_area = np.empty_like(burn_area)
+
+        for i, segment in enumerate(self.segments):
+            if segment.accepts_web_distance_arrays:
+                burn_area[i] = segment.get_burn_area(web_distance)
+                port_area[i] = segment.get_port_area(web_distance)
+            else:
+                burn_area[i] = [
+                    segment.get_burn_area(web) for web in web_distance
+                ]
+                port_area[i] = [
+                    segment.get_port_area(web) for web in web_distance
+                ]
+
+        # The mass flow through the port of a segment is generated by that
+        # segment and by every segment upstream of it (closer to the
+        # bulkhead):
+        total_burn_area = np.cumsum(burn_area, axis=0)
+
+        return (total_burn_area * (propellant_density * burn_rate)) / port_area
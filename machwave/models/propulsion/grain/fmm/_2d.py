@@ -2,11 +2,9 @@ from abc import ABC
 from typing import Callable, Optional
 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.signal import savgol_filter
 
 
-from . import FMMGrainSegment
+from . import FMMGrainSegment, _make_grid
 from .. import GrainSegment2D, GrainGeometryError
 from machwave.services.math.geometric import (
     get_circle_area,
@@ -50,20 +48,10 @@ class FMMGrainSegment2D(FMMGrainSegment, GrainSegment2D, ABC):
         Returns a tuple, containing map_x in index 0 and map_y in index 1.
         """
         if self.maps is None:
-            self.maps = np.meshgrid(
-                np.linspace(-1, 1, self.map_dim),
-                np.linspace(-1, 1, self.map_dim),
-            )
+            self.maps = _make_grid(self.map_dim)
 
         return self.maps
 
-    def get_mask(self) -> np.ndarray:
-        if self.mask is None:
-            map_x, map_y = self.get_maps()
-            self.mask = (map_x**2 + map_y**2) > 1
-
-        return self.mask
-
     def get_contours(self, web_distance: float) -> np.ndarray:
         map_dist = self.normalize(web_distance)
         return get_contours(self.get_regression_map(), map_dist)
@@ -80,26 +68,22 @@ class FMMGrainSegment2D(FMMGrainSegment, GrainSegment2D, ABC):
         """
 
         if self.face_area_interp_func is None:
+            # scipy.signal and scipy.interpolate are slow to import and only
+            # needed for FMM 2D segments, so they are imported here:
+            from scipy.interpolate import interp1d
+            from scipy.signal import savgol_filter
+
             regression_map = self.get_regression_map()
-            max_dist = np.amax(regression_map)
-
-            face_area = []
-            web_distance_normalized = []
-            valid = np.logical_not(self.get_mask())
-
-            for i in range(int(max_dist * self.map_dim) + 2):
-                web_distance_normalized.append(i / self.map_dim)
-
-                face_area.append(
-                    self.map_to_area(
-                        np.count_nonzero(
-                            np.logical_and(
-                                regression_map > (web_distance_normalized[-1]),
-                                valid,
-                            )
-                        )
-                    )
-                )
+            max_dist = float(np.amax(regression_map))
+
+            # The table is built in double precision, even though the
+            # regression map is stored in single precision:
+            web_distance_normalized = (
+                np.arange(int(max_dist * self.map_dim) + 2, dtype=np.float64)
+                / self.map_dim
+            )
+            remaining_cells = self.count_unburnt_cells(web_distance_normalized)
+            face_area = self.map_to_area(remaining_cells.astype(np.float64))
 
             face_area = savgol_filter(face_area, 31, 5)
             self.face_area_interp_func = interp1d(
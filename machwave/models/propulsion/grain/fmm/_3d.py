@@ -3,7 +3,7 @@ from typing import Optional
 
 import numpy as np
 
-from . import FMMGrainSegment
+from . import FMMGrainSegment, _make_grid
 from .. import GrainSegment3D, GrainGeometryError
 from machwave.services.math.geometric import (
     get_circle_area,
@@ -40,8 +40,14 @@ class FMMGrainSegment3D(FMMGrainSegment, GrainSegment3D, ABC):
         )
 
     def get_port_area(self, web_distance: float) -> np.ndarray:
-        face_map = self.get_face_map(web_distance=web_distance)[1]
-        face_area = self.map_to_area(np.count_nonzero(face_map == 1))
+        # Only the slice used for the port area is thresholded, instead of
+        # building the face map of the whole volume:
+        regression_slice = self.get_regression_map()[1]
+        valid = np.logical_not(self.get_mask()[1])
+        unburnt = np.logical_and(
+            regression_slice > self.normalize(web_distance), valid
+        )
+        face_area = self.map_to_area(np.count_nonzero(unburnt))
         return get_circle_area(self.outer_diameter) - face_area
 
     def get_normalized_length(self) -> int:
@@ -49,72 +55,61 @@ class FMMGrainSegment3D(FMMGrainSegment, GrainSegment3D, ABC):
 
     def get_maps(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         if self.maps is None:
-            map_y, map_z, map_x = np.meshgrid(
-                np.linspace(-1, 1, self.map_dim),
-                np.linspace(1, 0, self.get_normalized_length()),  # z axis
-                np.linspace(-1, 1, self.map_dim),
-            )
-
-            self.maps = (map_x, map_y, map_z)
+            self.maps = _make_grid(self.map_dim, self.get_normalized_length())
 
         return self.maps
 
-    def get_mask(self) -> np.ndarray:
-        if self.mask is None:
-            map_x, map_y, _ = self.get_maps()
-            self.mask = (map_x**2 + map_y**2) > 1
-
-        return self.mask
-
     def get_contours(
         self, web_distance: float, length_normalized: float
     ) -> np.ndarray:
         map_dist = self.normalize(web_distance)
-        valid = np.logical_not(self.get_mask())
 
-        map = np.logical_and(self.get_regression_map() > (map_dist), valid)
+        # Only the requested slice is thresholded, instead of the whole
+        # regression volume:
+        regression_slice = self.get_regression_map()[length_normalized]
+        valid = np.logical_not(self.get_mask()[length_normalized])
+
+        map = np.logical_and(regression_slice > (map_dist), valid)
 
         return get_contours(
-            map[length_normalized],
+            map,
             map_dist,
         )
 
     def get_burn_area(self, web_distance: float) -> float:
         """
-        NOTE 1: Still needs to be validated.
-        NOTE 2: Refactor to use only numpy arrays.
+        NOTE: Still needs to be validated.
         """
         if web_distance > self.get_web_thickness():
             return 0
 
-        burn_area_array = np.array([])
-
-        for i in range(self.get_normalized_length()):
-            contours = self.get_contours(
-                web_distance=web_distance, length_normalized=i
-            )
-            perimeter = np.sum(
-                [
-                    self.map_to_length(get_length(contour, self.map_dim))
-                    for contour in contours
-                ]
-            )
-
-            burn_area_array = np.append(
-                burn_area_array,
-                perimeter
-                * self.get_length(web_distance=web_distance)
-                / self.map_dim,
-            )
+        perimeters = np.array(
+            [
+                np.sum(
+                    [
+                        self.map_to_length(get_length(contour, self.map_dim))
+                        for contour in self.get_contours(
+                            web_distance=web_distance, length_normalized=i
+                        )
+                    ]
+                )
+                for i in range(self.get_normalized_length())
+            ]
+        )
 
-        return np.sum(burn_area_array)
+        return (
+            np.sum(perimeters)
+            * self.get_length(web_distance=web_distance)
+            / self.map_dim
+        )
 
     def get_volume_per_element(self) -> float:
         return (self.denormalize(self.get_cell_size()) * 2) ** 3
 
     def get_volume(self, web_distance: float) -> float:
-        face_map = self.get_face_map(web_distance=web_distance)
-        active_elements = np.count_nonzero(face_map == 1)
+        active_elements = self.count_unburnt_cells(
+            self.normalize(web_distance)
+        )
         volume_per_element = self.get_volume_per_element()
         return active_elements * volume_per_element
 
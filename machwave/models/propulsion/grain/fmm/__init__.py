@@ -1,13 +1,47 @@
+import functools
 from abc import ABC, abstractmethod
 from typing import Optional
 
 import numpy as np
-import skfmm
+from scipy.ndimage import distance_transform_edt
 
 from .. import GrainGeometryError, GrainSegment
 from machwave.services.decorators import validate_assertions
 
 
+@functools.lru_cache(maxsize=16)
+def _make_grid(
+    map_dim: int, normalized_length: Optional[int] = None
+) -> tuple[np.ndarray, ...]:
+    """
+    Returns the normalized meshgrid of a FMM grain segment. Segments with the
+    same map dimensions share the same (read-only) arrays.
+
+    :param int map_dim: Number of points along the diameter of the segment.
+    :param Optional[int] normalized_length: Number of points along the
+        length of the segment. If None, a 2D grid is returned.
+    :return: (map_x, map_y) for a 2D grid or (map_x, map_y, map_z) for a 3D
+        grid.
+    :rtype: tuple[np.ndarray, ...]
+    """
+    axis = np.linspace(-1, 1, map_dim, dtype=np.float32)
+
+    if normalized_length is None:
+        maps = tuple(np.meshgrid(axis, axis))
+    else:
+        map_y, map_z, map_x = np.meshgrid(
+            axis,
+            np.linspace(1, 0, normalized_length, dtype=np.float32),  # z axis
+            axis,
+        )
+        maps = (map_x, map_y, map_z)
+
+    for grid in maps:
+        grid.flags.writeable = False
+
+    return maps
+
+
 class FMMGrainSegment(GrainSegment, ABC):
     """
     Fast Marching Method (FMM) implementation of a grain segment.
@@ -30,9 +64,11 @@ class FMMGrainSegment(GrainSegment, ABC):
 
         # "Cache" variables:
         self.maps = None
+        self.radius_map = None
         self.mask = None
         self.masked_face = None
         self.regression_map = None
+        self.sorted_regression_values = None
 
         super().__init__(
             length=length,
@@ -55,18 +91,12 @@ class FMMGrainSegment(GrainSegment, ABC):
         """
         pass
 
-    @abstractmethod
-    def get_mask(self) -> np.ndarray:
-        """
-        Implementation varies depending if the geometry is 2D or 3D.
-        """
-        pass
-
     @validate_assertions(exception=GrainGeometryError)
     def validate(self) -> None:
         super().validate()
 
-        assert self.map_dim >= 100
+        assert isinstance(self.map_dim, (int, np.integer))
+        assert 100 <= self.map_dim <= 4096
 
     def normalize(self, value: int | float) -> float:
         return value / (0.5 * self.outer_diameter)
@@ -88,13 +118,35 @@ class FMMGrainSegment(GrainSegment, ABC):
         """
         return self.outer_diameter * (value / self.map_dim)
 
-    def get_empty_face_map(self) -> np.ndarray:
+    def get_radius_map(self) -> np.ndarray:
+        """
+        Returns the (normalized) radial distance of each point of the map to
+        the axis of the grain segment.
+        """
+        if self.radius_map is None:
+            map_x, map_y = self.get_maps()[:2]
+            self.radius_map = np.hypot(map_x, map_y)
+
+        return self.radius_map
+
+    def get_mask(self) -> np.ndarray:
+        """
+        Masks every point of the map outside of the outer diameter of the
+        grain segment.
         """
-        Returns the empty geometry map/mesh of the grain.
+        if self.mask is None:
+            self.mask = self.get_radius_map() > 1
+
+        return self.mask
 
-        https://pythonhosted.org/scikit-fmm/
+    def get_empty_face_map(self) -> np.ndarray:
+        """
+        Returns the empty geometry map/mesh of the grain. Child classes set
+        the cells of the initial burning surface (core) to 0, from which the
+        regression map is computed with a Euclidean distance transform (see
+        get_regression_map).
         """
-        return np.ones_like(self.get_maps()[0])
+        return np.ones_like(self.get_maps()[0], dtype=np.float32)
 
     def get_masked_face(self) -> np.ndarray:
         """
@@ -103,7 +155,8 @@ class FMMGrainSegment(GrainSegment, ABC):
         """
         if self.masked_face is None:
             self.masked_face = np.ma.MaskedArray(
-                self.get_initial_face_map(), self.get_mask()
+                self.get_initial_face_map().astype(np.float32, copy=False),
+                self.get_mask(),
             )
 
         return self.masked_face
@@ -113,23 +166,83 @@ class FMMGrainSegment(GrainSegment, ABC):
 
     def get_regression_map(self):
         """
-        Uses the fast marching method to generate an image of how the grain
-        regresses from the core map.
+        Generates an image of how the grain regresses from the core map.
+
+        For a uniform burn rate the regression front is the distance to the
+        initial burning surface, which is obtained with an exact Euclidean
+        distance transform. Points outside of the grain are masked and never
+        act as a burning surface.
         """
         if self.regression_map is None:
-            self.regression_map = (
-                skfmm.distance(self.get_masked_face(), dx=self.get_cell_size())
-                * 2
+            mask = self.get_mask()
+            burning_surface = np.logical_and(
+                np.ma.getdata(self.get_masked_face()) == 0,
+                np.logical_not(mask),
+            )
+            distance = distance_transform_edt(np.logical_not(burning_surface))
+
+            # Single precision is enough for the regression front and halves
+            # the memory traffic of every query on the map:
+            self.regression_map = np.ma.MaskedArray(
+                (distance * self.get_cell_size() * 2).astype(np.float32),
+                mask,
             )
 
         return self.regression_map
 
+    def get_sorted_regression_values(self) -> np.ndarray:
+        """
+        Returns the regression map values of every point inside the grain
+        segment, sorted in ascending order.
+        """
+        if self.sorted_regression_values is None:
+            valid = np.logical_not(self.get_mask())
+            self.sorted_regression_values = np.sort(
+                np.ma.getdata(self.get_regression_map())[valid]
+            )
+
+        return self.sorted_regression_values
+
+    def count_unburnt_cells(
+        self, web_distance_normalized: float | np.ndarray
+    ) -> int | np.ndarray:
+        """
+        Counts the points of the map that have not burnt yet, i.e. with a
+        regression value greater than the (normalized) web distance. Accepts
+        a single value or an array of web distances.
+
+        :param float | np.ndarray web_distance_normalized: Normalized web
+            distance(s) traveled.
+        :return: Number of unburnt points for each web distance.
+        :rtype: int | np.ndarray
+        """
+        regression_values = self.get_sorted_regression_values()
+        web_distance_normalized = np.asarray(web_distance_normalized)
+
+        # Searching with another dtype would cast the whole sorted array on
+        # every call. The web distance is rounded down instead, so that the
+        # values counted as burnt are the same as when comparing in its own
+        # precision:
+        needle = web_distance_normalized.astype(regression_values.dtype)
+        needle = np.where(
+            needle > web_distance_normalized,
+            np.nextafter(needle, needle.dtype.type(-np.inf)),
+            needle,
+        )
+
+        return (
+            regression_values.size
+            - np.searchsorted(regression_values, needle, side="right")
+        )[()]
+
     def get_web_thickness(self) -> float:
         """
         The distance between the closest and furthest point to the center of
         the grain segment.
         """
-        return self.denormalize(np.amax(self.get_regression_map()))
+        # The regression map is stored in single precision, but the solver
+        # works in double precision:
+        return float(self.denormalize(np.amax(self.get_regression_map())))
 
     @abstractmethod
     def get_contours(self, web_distance: float, *args, **kwargs) -> np.ndarray:
@@ -161,3 +274,4 @@ class FMMGrainSegment(GrainSegment, ABC):
 
         face_mask = log_and * 1  # replace True and False with 1 and 0
         return face_mask.filled(-1)  # fill masked values with -1
+
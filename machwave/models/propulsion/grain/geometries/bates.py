@@ -10,6 +10,8 @@ from machwave.services.decorators import validate_assertions
 
 
 class BatesSegment(GrainSegment2D):
+    accepts_web_distance_arrays = True
+
     def __init__(
         self,
         outer_diameter: float,
@@ -48,6 +50,38 @@ class BatesSegment(GrainSegment2D):
         core_diameter = self.get_core_diameter(web_distance)
         return np.pi * (((self.outer_diameter**2) - (core_diameter) ** 2) / 4)
 
+    def get_burn_area(self, web_distance: float | np.ndarray) -> float:
+        """
+        Also accepts an array of web distances, evaluated with a branchless
+        version of GrainSegment2D.get_burn_area. Scalars, as given by the
+        solver on every step, are evaluated directly.
+        """
+        if isinstance(web_distance, (float, int)):
+            return super().get_burn_area(web_distance)
+
+        web_distance = np.asarray(web_distance)
+        burn_area = self.get_core_area(web_distance) + (
+            2 - self.inhibited_ends
+        ) * self.get_face_area(web_distance)
+        is_burning = web_distance <= self.get_web_thickness()
+        return np.where(is_burning, burn_area, 0)[()]
+
+    def get_volume(self, web_distance: float | np.ndarray) -> float:
+        """
+        Also accepts an array of web distances, evaluated with a branchless
+        version of GrainSegment2D.get_volume. Scalars, as given by the
+        solver on every step, are evaluated directly.
+        """
+        if isinstance(web_distance, (float, int)):
+            return super().get_volume(web_distance)
+
+        web_distance = np.asarray(web_distance)
+        volume = self.get_length(web_distance) * self.get_face_area(
+            web_distance
+        )
+        is_burning = web_distance <= self.get_web_thickness()
+        return np.where(is_burning, volume, 0)[()]
+
     def get_web_thickness(self) -> float:
         """
         More details on the web thickness of BATES grains can be found in:
@@ -38,13 +38,13 @@ class ConicalGrainSegment(FMMGrainSegment3D):
         assert self.lower_core_diameter < self.outer_diameter
 
     def get_initial_face_map(self) -> np.ndarray:
-        map_x, map_y, map_z = self.get_maps()
+        map_z = self.get_maps()[2]
         core_map = self.get_empty_face_map()
 
         upper_core_norm = self.normalize(self.upper_core_diameter)
         lower_core_norm = self.normalize(self.lower_core_diameter)
 
-        radius = np.sqrt(map_x**2 + map_y**2)
+        radius = self.get_radius_map()
         core_diameter = (
             map_z * (upper_core_norm - lower_core_norm) + lower_core_norm
         )
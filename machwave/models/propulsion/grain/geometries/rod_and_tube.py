@@ -39,13 +39,12 @@ class RodAndTubeGrainSegment(FMMGrainSegment2D):
         """
         NOTE: Still needs to correctly implement wagon wheel ports.
         """
-        map_x, map_y = self.get_maps()
         core_map = self.get_empty_face_map()
 
         rod_od_norm = self.normalize(self.rod_outer_diameter)
         tube_id_norm = self.normalize(self.tube_inner_diameter)
 
-        radius = np.sqrt(map_x**2 + map_y**2)
+        radius = self.get_radius_map()
 
         # Create the ring:
         core_map[(radius > rod_od_norm / 2) & (radius < tube_id_norm / 2)] = 0
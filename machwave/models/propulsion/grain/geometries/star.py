@@ -52,7 +52,7 @@ class StarGrainSegment(FMMGrainSegment2D):
         point_length_norm = self.normalize(self.point_length)
         point_width_norm = self.normalize(self.point_width)
 
-        radius = (map_x**2 + map_y**2) ** 0.5
+        radius = self.get_radius_map()
 
         for i in range(0, self.number_of_points):
             theta = 2 * np.pi / self.number_of_points * i
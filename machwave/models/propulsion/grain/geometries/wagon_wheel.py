@@ -57,7 +57,7 @@ class WagonWheelGrainSegment(FMMGrainSegment2D):
         port_inner_diameter_norm = self.normalize(self.port_inner_diameter)
         port_outer_diameter_norm = self.normalize(self.port_outer_diameter)
 
-        radius = np.sqrt(map_x**2 + map_y**2)
+        radius = self.get_radius_map()
 
         # Create the core:
         core_map[radius < core_diameter_norm / 2] = 0
@@ -19,6 +19,13 @@ class Recovery:
         """
         self.events.append(recovery_event)
 
+    def reset(self) -> None:
+        """
+        Resets every recovery event before a new flight.
+        """
+        for event in self.events:
+            event.reset()
+
     def get_drag_coefficient_and_area(
         self,
         height: np.ndarray,
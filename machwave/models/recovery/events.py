@@ -17,6 +17,13 @@ class RecoveryEvent(ABC):
         self.trigger_value = trigger_value
         self.parachute = parachute
 
+    def reset(self) -> None:
+        """
+        Clears any state kept from a previous flight. Called when a new
+        flight starts.
+        """
+        pass
+
     @abstractmethod
     def is_active(
         self,
@@ -79,6 +86,42 @@ class ApogeeBasedEvent(RecoveryEvent):
             parachute (Parachute): The parachute associated with the event.
         """
         super().__init__(trigger_value, parachute)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears the apogee tracked in the previous flight.
+        """
+        # The apogee is tracked incrementally, since the flight history only
+        # grows during a flight:
+        self._apogee_index = 0
+        self._checked_samples = 0
+
+    def get_apogee_index(self, height: np.ndarray) -> int:
+        """
+        Gets the index of the apogee in the height history. Only the heights
+        added since the previous call are searched, so the event must be
+        reset before a new flight.
+
+        Args:
+            height (np.ndarray): The array of heights.
+
+        Returns:
+            int: Index of the (first) maximum height.
+        """
+        if len(height) > self._checked_samples:
+            new_heights = height[self._checked_samples :]
+            new_max_index = self._checked_samples + int(np.argmax(new_heights))
+
+            if (
+                self._checked_samples == 0
+                or height[new_max_index] > height[self._apogee_index]
+            ):
+                self._apogee_index = new_max_index
+
+            self._checked_samples = len(height)
+
+        return self._apogee_index
 
     def is_active(
         self,
@@ -103,14 +146,16 @@ class ApogeeBasedEvent(RecoveryEvent):
         Returns:
             bool: True if the apogee-based recovery event is active, False otherwise.
         """
-        max_height_index = np.argmax(height)
-        apogee_time = time[max_height_index]
-
-        if (
+        if not (
             propellant_mass == 0  # Propellant is depleted
             and velocity[-1] < 0  # Descending velocity
-            and time[-1] >= self.trigger_value + apogee_time  # Time condition
         ):
+            return False
+
+        # The apogee is only looked up once the conditions above are met:
+        apogee_time = time[self.get_apogee_index(height)]
+
+        if time[-1] >= self.trigger_value + apogee_time:  # Time condition
             return True
         else:
             return False
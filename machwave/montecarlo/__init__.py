@@ -1,10 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, List, Optional
-import uuid
+from itertools import repeat
+import numbers
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
-import plotly.graph_objects as go
 
 from machwave.montecarlo.random import get_random_generator
 from machwave.operations import Operation
@@ -14,6 +15,124 @@ from machwave.services.common import obtain_attributes_from_object
 SEARCH_TREE_DEPTH_LIMIT = 20
 
 
+def _defines_property(operation: Operation, name: str) -> bool:
+    """
+    Returns whether an operation defines an attribute or property, either in
+    its type or in its instance dictionary.
+    """
+    return hasattr(type(operation), name) or name in getattr(
+        operation, "__dict__", {}
+    )
+
+
+class OperationSummary:
+    """
+    Stores only some of the attributes and properties of an operation, so
+    that the results of a scenario are small and cheap to send back from a
+    worker process.
+    """
+
+    def __init__(self, operation: Operation, properties: List[str]) -> None:
+        """
+        Initializes an OperationSummary object.
+
+        Args:
+            operation: Operation to be summarized.
+            properties: Names of the attributes or properties to be stored.
+                The ones that the operation does not define are skipped.
+        """
+        for property in properties:
+            if _defines_property(operation, property):
+                setattr(self, property, getattr(operation, property))
+
+
+def _set_value_at_path(root: List[Any], path: tuple, value: Any) -> None:
+    """
+    Sets a value in a nested structure of lists and objects, given its path
+    of list indices (int) and attribute names (str).
+    """
+    obj = root
+    for key in path[:-1]:
+        obj = obj[key] if isinstance(key, int) else getattr(obj, key)
+
+    if isinstance(path[-1], int):
+        obj[path[-1]] = value
+    else:
+        setattr(obj, path[-1], value)
+
+
+def _run_scenario(
+    simulation: Simulation,
+    scenario: List[Any],
+    properties: Optional[List[str]] = None,
+) -> List[Operation | OperationSummary]:
+    """
+    Runs a single Monte Carlo scenario. Defined at module level so that it
+    can be dispatched to worker processes.
+
+    Raises:
+        ValueError: If a requested property is not defined by any of the
+            operations of the scenario.
+    """
+    operations = simulation(*scenario).run()
+
+    if properties is None:
+        return operations
+
+    for property in properties:
+        if not any(
+            _defines_property(operation, property) for operation in operations
+        ):
+            raise ValueError(
+                f"Property '{property}' is not defined by any of the "
+                f"operations of {simulation.__name__}."
+            )
+
+    return [
+        OperationSummary(operation, properties) for operation in operations
+    ]
+
+
+def _warm_up_worker(scenario: List[Any]) -> None:
+    """
+    Builds the caches shared by every scenario in a process, i.e. the tables
+    of the 1976 Standard Atmosphere and the FMM meshgrids, for the models
+    found in a scenario. Used as the initializer of the worker processes, so
+    that they are built before any scenario is received instead of while
+    simulating the first one.
+    """
+    # Imported here so that the Monte Carlo module does not import every
+    # model on its own:
+    from machwave.models.atmosphere.atm_1976 import Atmosphere1976
+    from machwave.models.propulsion.grain.fmm import FMMGrainSegment
+
+    visited = set()
+    search_tree = list(scenario)
+
+    for _ in range(SEARCH_TREE_DEPTH_LIMIT):
+        new_search_tree = []
+
+        for item in search_tree:
+            if id(item) in visited or isinstance(item, (dict, np.ndarray)):
+                continue
+
+            visited.add(id(item))
+
+            if isinstance(item, Atmosphere1976):
+                item.get_tables()
+            elif isinstance(item, FMMGrainSegment):
+                item.get_maps()
+
+            if isinstance(item, list):
+                new_search_tree.extend(item)
+            else:
+                new_search_tree.extend(
+                    obtain_attributes_from_object(item).values()
+                )
+
+        search_tree = new_search_tree
+
+
 @dataclass
 class MonteCarloParameter:
     """
@@ -43,15 +162,59 @@ class MonteCarloParameter:
             upper_tolerance=self.upper_tolerance,
             tolerance=self.tolerance,
         )
+        self._samples: Optional[np.ndarray] = None
+        self._sample_index = 0
+
+    def __deepcopy__(self, memo: dict) -> "MonteCarloParameter":
+        """
+        A parameter only describes a distribution, so copies of the objects
+        that hold it (one per Monte Carlo scenario) share the same instance
+        and its pre-drawn samples.
+        """
+        return self
+
+    def sample(self, size: int) -> np.ndarray:
+        """
+        Generates an array of random values for the parameter, according to
+        the probability distribution and tolerances, in a single call to the
+        random generator.
+
+        Args:
+            size: Number of random values
+
+        Returns:
+            Array of random values
+        """
+        return self.probability_distribution_class.get_values(size)
+
+    def set_samples(self, samples: Optional[np.ndarray]) -> None:
+        """
+        Sets pre-drawn random values to be returned, in order, by
+        get_random_value. Passing None discards them.
+
+        Args:
+            samples: Array of random values or None
+        """
+        self._samples = samples
+        self._sample_index = 0
 
     def get_random_value(self) -> float:
         """
         Generates a random value for the parameter, according to the
         probability distribution and tolerances.
 
+        If pre-drawn samples were set, the next one is returned instead.
+
         Returns:
             Random value
         """
+        if self._samples is not None and self._sample_index < len(
+            self._samples
+        ):
+            value = self._samples[self._sample_index]
+            self._sample_index += 1
+            return value
+
         return self.probability_distribution_class.get_value()
 
     def __lt__(self, other: Any) -> bool:
@@ -115,101 +278,165 @@ class MonteCarloSimulation:
         self.number_of_scenarios = number_of_scenarios
         self.simulation = simulation
 
-        self.scenarios: List[List[float | int]] = []
-        self.results: List[List[Operation]] = []
+        self.scenarios: List[List[Any]] = []
+        self.results: List[List[Operation | OperationSummary]] = []
 
-        self._object_store = (
-            dict()
-        )  # maps UUIDs to objects in generate_scenario
+        # Paths to the MonteCarloParameter instances, found once and reused
+        # for every scenario:
+        self._parameter_paths: Optional[List[Tuple[tuple, Any]]] = None
 
-    def generate_scenario(self) -> List[float | int]:
+    def get_parameter_paths(self) -> List[Tuple[tuple, "MonteCarloParameter"]]:
         """
-        Generates a Monte Carlo scenario in the form of a list of parameters.
+        Searches the input parameters, their attributes and list items
+        recursively for MonteCarloParameter instances.
 
-        These parameters are randomly generated within the tolerance bounds,
-        set in the MonteCarloParameter class. The random numbers follow a
-        Gaussian distribution.
+        Each object is searched once, even if it is referenced more than once
+        (e.g. the same segment added several times to a grain), since copies
+        of the parameters keep those references shared.
 
         Returns:
-            Monte Carlo scenario
+            List of (path, parameter) pairs. A path starts with the index of
+            the input parameter, followed by attribute names (str) and list
+            indices (int).
         """
-        new_scenario = []
-        parameters_copy = deepcopy(self.parameters)
+        if self._parameter_paths is None:
+            self._parameter_paths = []
+            visited = set()
+            search_tree = [
+                ((index,), parameter)
+                for index, parameter in enumerate(self.parameters)
+            ]
 
-        for parameter in parameters_copy:
-            if isinstance(parameter, MonteCarloParameter):
-                parameter = parameter.get_random_value()
-            else:  # search for MonteCarloParameter instances recursively
-                self._process_nested_parameters(parameter)
+            i = 0  # iteration counter
 
-            new_scenario.append(parameter)
+            while search_tree and i <= SEARCH_TREE_DEPTH_LIMIT:
+                i += 1
+                new_search_tree = []
 
-        self.scenarios.append(new_scenario)
-        return new_scenario
+                for path, item in search_tree:
+                    if isinstance(item, MonteCarloParameter):
+                        self._parameter_paths.append((path, item))
+                        continue
 
-    def _process_nested_parameters(self, parameter: Any) -> None:
-        """
-        Recursively processes an object's attributes to replace
-        MonteCarloParameter instances with randomized values and store objects
-        using UUIDs.
+                    if id(item) in visited or isinstance(item, dict):
+                        continue
 
-        Args:
-            parameter: The object whose attributes will be processed.
-        """
-        parameter_uuid = uuid.uuid4()
-        self._object_store[parameter_uuid] = parameter
-        search_tree = {
-            parameter_uuid: obtain_attributes_from_object(parameter)
-        }
+                    visited.add(id(item))
 
-        i = 0  # iteration counter
+                    if isinstance(item, list):
+                        children = enumerate(item)
+                    else:
+                        children = obtain_attributes_from_object(item).items()
 
-        while search_tree and i < SEARCH_TREE_DEPTH_LIMIT:
-            i += 1
-            new_search_tree = {}
+                    new_search_tree.extend(
+                        (path + (key,), child) for key, child in children
+                    )
 
-            for param_uuid, sub_params in search_tree.items():
-                param = self._object_store[param_uuid]
+                search_tree = new_search_tree
 
-                for name, attr in sub_params.items():
-                    object_uuid = uuid.uuid4()
+        return self._parameter_paths
 
-                    if isinstance(attr, MonteCarloParameter):
-                        setattr(param, name, attr.get_random_value())
-                    elif isinstance(attr, list):
-                        for item in attr:
-                            if isinstance(item, dict):
-                                continue
+    def generate_scenario(self) -> List[Any]:
+        """
+        Generates a Monte Carlo scenario in the form of a list of parameters.
 
-                            self._object_store[object_uuid] = item
+        The input parameters are copied and every MonteCarloParameter in them
+        is replaced by a random value within its tolerance bounds, following
+        its probability distribution.
 
-                            new_search_tree[object_uuid] = (
-                                obtain_attributes_from_object(item)
-                            )
-                    else:
-                        object_uuid = uuid.uuid4()
-                        self._object_store[object_uuid] = attr
+        Returns:
+            Monte Carlo scenario
+        """
+        scenario = deepcopy(self.parameters)
 
-                        new_search_tree[object_uuid] = (
-                            obtain_attributes_from_object(attr)
-                        )
+        for path, parameter in self.get_parameter_paths():
+            _set_value_at_path(scenario, path, parameter.get_random_value())
 
-            search_tree = new_search_tree
+        self.scenarios.append(scenario)
+        return scenario
 
-    def run(self) -> None:
+    def run(
+        self,
+        max_workers: Optional[int] = None,
+        properties: Optional[List[str]] = None,
+    ) -> None:
         """
         Executes the Monte Carlo simulation.
+
+        Scenarios are always generated in the current process, so the random
+        values drawn do not depend on the number of workers. The scenarios
+        are independent from each other and can be simulated in parallel
+        processes, in which case the simulation class and its parameters
+        must be picklable.
+
+        Worker processes are started with the default method of the
+        platform. The caches that are built once per process (atmosphere
+        tables, FMM grids) are built here before the workers start, so forked
+        workers inherit them, and by each worker as it starts otherwise.
+
+        Args:
+            max_workers: Number of worker processes. If None or 1, the
+                scenarios are simulated sequentially in the current process,
+                as are simulations with a single scenario.
+            properties: Names of the attributes or properties of the
+                operations to keep in the results. If given, each operation
+                is replaced by an OperationSummary with only these values,
+                instead of keeping its full history. By default, the
+                operations are kept.
         """
         self.results = []
 
-        for _ in range(self.number_of_scenarios):
-            scenario = self.generate_scenario()
-            self.results.append(self.simulation(*scenario).run())
+        # Every parameter draws the values for all scenarios at once:
+        counts: dict[int, list] = {}
+        for _, parameter in self.get_parameter_paths():
+            counts.setdefault(id(parameter), [parameter, 0])[1] += 1
+
+        parameters = counts.values()
+        for parameter, count in parameters:
+            parameter.set_samples(
+                parameter.sample(count * self.number_of_scenarios)
+            )
+
+        try:
+            scenarios = [
+                self.generate_scenario()
+                for _ in range(self.number_of_scenarios)
+            ]
+        finally:
+            for parameter, _ in parameters:
+                parameter.set_samples(None)
+
+        if max_workers is None or max_workers <= 1 or len(scenarios) <= 1:
+            self.results = [
+                _run_scenario(self.simulation, scenario, properties)
+                for scenario in scenarios
+            ]
+            return
+
+        _warm_up_worker(scenarios[0])
+
+        chunksize = max(1, len(scenarios) // (4 * max_workers))
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_warm_up_worker,
+            initargs=(scenarios[0],),
+        ) as executor:
+            self.results.extend(
+                executor.map(
+                    _run_scenario,
+                    repeat(self.simulation),
+                    scenarios,
+                    repeat(properties),
+                    chunksize=chunksize,
+                )
+            )
 
     def retrieve_values_from_result(
         self,
         operation_index: int,
         property: str,
+        dtype: type = np.float64,
     ) -> np.ndarray:
         """
         Retrieves a specific property from the simulation results.
@@ -219,16 +446,22 @@ class MonteCarloSimulation:
                 property from.
             property: Name of the property or the attribute of the operation
                 to retrieve.
+            dtype: Data type of the returned array, when every value is a
+                real scalar. Other values (e.g. arrays or strings) are
+                gathered with np.array, which infers the data type instead.
 
         Returns:
             Numpy array containing the values of the specified property.
         """
-        return np.array(
-            [
-                getattr(result[operation_index], property)
-                for result in self.results
-            ]
-        )
+        values = [
+            getattr(result[operation_index], property)
+            for result in self.results
+        ]
+
+        if all(isinstance(value, numbers.Real) for value in values):
+            return np.fromiter(values, dtype=dtype, count=len(values))
+
+        return np.array(values)
 
     def plot_histogram(
         self,
@@ -251,6 +484,9 @@ class MonteCarloSimulation:
             **kwargs: Additional keyword arguments to pass to the histogram
                 plot.
         """
+        # Plotly is only needed here, so worker processes never import it:
+        import plotly.graph_objects as go
+
         values = self.retrieve_values_from_result(
             operation_index=operation_index, property=property
         )
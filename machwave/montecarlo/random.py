@@ -21,6 +21,7 @@ class RandomGenerator(ABC):
 
     Methods:
         get_value(): Gets a random value based on a probability distribution.
+        get_values(size): Gets an array of random values.
 
     """
 
@@ -49,6 +50,19 @@ class RandomGenerator(ABC):
         """
         pass
 
+    def get_values(self, size: int) -> np.ndarray:
+        """
+        Gets an array of random values based on a probability distribution.
+        Subclasses should override it with a single vectorized draw.
+
+        Args:
+            size (int): Number of random values.
+
+        Returns:
+            Array of random values.
+        """
+        return np.array([self.get_value() for _ in range(size)])
+
 
 @dataclass
 class NormalRandomGenerator(RandomGenerator):
@@ -102,6 +116,21 @@ class NormalRandomGenerator(RandomGenerator):
         """
         return np.random.normal(loc=self.value, scale=self.tolerance / 3)
 
+    def get_values(self, size: int) -> np.ndarray:
+        """
+        Gets an array of random values based on a normal probability
+        distribution, with a single call to numpy.random.
+
+        Args:
+            size (int): Number of random values.
+
+        Returns:
+            Array of random values.
+        """
+        return np.random.normal(
+            loc=self.value, scale=self.tolerance / 3, size=size
+        )
+
 
 @dataclass
 class UniformRandomGenerator(RandomGenerator):
@@ -153,6 +182,23 @@ class UniformRandomGenerator(RandomGenerator):
             high=self.value + self.upper_tolerance + self.tolerance,
         )
 
+    def get_values(self, size: int) -> np.ndarray:
+        """
+        Gets an array of random values based on a uniform probability
+        distribution, with a single call to numpy.random.
+
+        Args:
+            size (int): Number of random values.
+
+        Returns:
+            Array of random values.
+        """
+        return np.random.uniform(
+            low=self.value - self.lower_tolerance - self.tolerance,
+            high=self.value + self.upper_tolerance + self.tolerance,
+            size=size,
+        )
+
 
 def get_random_generator(
     probability_distribution: str, *args, **kwargs
@@ -1,5 +1,57 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+
+class History:
+    """
+    Descriptor for a time history stored in an Operation.
+
+    The attribute is a plain numpy array with the values stored so far,
+    which is a view of a larger buffer. New values are added with
+    Operation.append_history, which grows the buffer geometrically instead
+    of copying the whole history on every iteration, like np.append does.
+    Assigning an array to the attribute replaces the history.
+
+    Only __set__ is defined, so reading the attribute is a regular instance
+    attribute lookup. The buffer is not pickled or copied with the operation
+    (see Operation.__getstate__), it is rebuilt on the next append.
+
+    Histories that are only kept for post-processing, and are not read back
+    by the simulation, can be stored in single precision with
+    dtype=np.float32.
+    """
+
+    def __init__(self, dtype: type = np.float64) -> None:
+        self.dtype = dtype
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.buffer_name = f"_{name}_buffer"
+
+    def __set__(self, obj, value) -> None:
+        buffer = np.array(value, dtype=self.dtype, ndmin=1)
+        obj.__dict__[self.buffer_name] = buffer
+        obj.__dict__[self.name] = buffer[:]
+
+    def append(self, obj, value: float) -> None:
+        history = obj.__dict__[self.name]
+        buffer = obj.__dict__.get(self.buffer_name)
+        size = history.size
+
+        # Copies (e.g. pickled or deep copied operations) only hold the
+        # history, without its buffer:
+        if buffer is None or history.base is not buffer:
+            buffer = history
+
+        if size == buffer.size:
+            buffer = np.empty(max(2 * size, 16), dtype=self.dtype)
+            buffer[:size] = history
+
+        buffer[size] = value
+        obj.__dict__[self.buffer_name] = buffer
+        obj.__dict__[self.name] = buffer[: size + 1]
+
 
 class Operation(ABC):
     """
@@ -31,3 +83,24 @@ class Operation(ABC):
         Prints some key values and metrics obtained from the operation.
         """
         pass
+
+    def __getstate__(self) -> dict:
+        # Only the values stored so far are pickled or copied, not the spare
+        # capacity of the History buffers:
+        state = self.__dict__.copy()
+        for klass in type(self).__mro__:
+            for attribute in vars(klass).values():
+                if isinstance(attribute, History):
+                    state.pop(attribute.buffer_name, None)
+
+        return state
+
+    def append_history(self, name: str, value: float) -> None:
+        """
+        Appends a value to one of the History attributes of the operation.
+
+        Args:
+            name (str): Name of the History attribute.
+            value (float): Value to be appended.
+        """
+        getattr(type(self), name).append(self, value)
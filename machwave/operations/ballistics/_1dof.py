@@ -3,6 +3,7 @@ from typing import Optional
 import numpy as np
 
 from . import BallisticOperation
+from machwave.operations import History
 from machwave.models.atmosphere import Atmosphere
 from machwave.models.rocket import Rocket
 from machwave.services.equations import ballistics_ode
@@ -12,6 +13,15 @@ from machwave.solvers.odes import rk4th_ode_solver
 class Ballistic1DOperation(BallisticOperation):
     """Stores and processes a ballistics operation (aka flight)."""
 
+    t = History()  # time vector
+    P_ext = History()  # external pressure
+    rho_air = History()  # air density
+    g = History()  # acceleration of gravity
+    vehicle_mass = History()  # total mass of the vehicle
+    y = History()  # altitude, AGL
+    v = History()  # velocity
+    acceleration = History(np.float32)
+
     def __init__(
         self,
         rocket: Rocket,
@@ -38,6 +48,9 @@ class Ballistic1DOperation(BallisticOperation):
         self.motor_dry_mass = motor_dry_mass
         self.initial_elevation_amsl = initial_elevation_amsl
 
+        # The recovery events may keep state from a previous flight:
+        self.rocket.recovery.reset()
+
         self.t = np.array([0])  # time vector
 
         self.P_ext = np.array(
@@ -57,10 +70,13 @@ class Ballistic1DOperation(BallisticOperation):
         self.y = np.array([0])  # altitude, AGL
         self.v = np.array([0])  # velocity
         self.acceleration = np.array([0])  # acceleration
-        self.mach_no = np.array([0])  # Mach number
 
         self.velocity_out_of_rail = None
 
+        # Set once the height goes above zero for the first time, so that the
+        # height history does not have to be searched on every iteration:
+        self.has_lifted_off = False
+
     @property
     def apogee(self) -> float:
         """Get the apogee of the operation."""
@@ -71,6 +87,16 @@ class Ballistic1DOperation(BallisticOperation):
         """Get the time of the apogee."""
         return self.t[np.argmax(self.y)]
 
+    @property
+    def mach_no(self) -> np.ndarray:
+        """
+        Get the Mach number history. The sonic velocity is only needed for
+        post-processing, so it is looked up for the whole flight at once.
+        """
+        return self.v / self.atmosphere.get_sonic_velocity(
+            self.y + self.initial_elevation_amsl
+        )
+
     @property
     def max_velocity(self) -> float:
         """Get the maximum velocity of the operation."""
@@ -95,16 +121,16 @@ class Ballistic1DOperation(BallisticOperation):
             thrust (float): The thrust force.
             d_t (float): The time step.
         """
-        self.t = np.append(self.t, self.t[-1] + d_t)  # append new time value
+        self.append_history("t", self.t[-1] + d_t)  # append new time value
 
-        self.rho_air = np.append(
-            self.rho_air,
+        self.append_history(
+            "rho_air",
             self.atmosphere.get_density(
                 y_amsl=(self.y[-1] + self.initial_elevation_amsl)
             ),
         )
-        self.g = np.append(
-            self.g,
+        self.append_history(
+            "g",
             self.atmosphere.get_gravity(
                 self.initial_elevation_amsl + self.y[-1]
             ),
@@ -112,8 +138,8 @@ class Ballistic1DOperation(BallisticOperation):
 
         # Appending the current vehicle mass, consisting of the motor
         # structural mass, mass without the motor, and propellant mass.
-        self.vehicle_mass = np.append(
-            self.vehicle_mass, propellant_mass + self.rocket.get_dry_mass()
+        self.append_history(
+            "vehicle_mass", propellant_mass + self.rocket.get_dry_mass()
         )
 
         # Drag properties:
@@ -152,25 +178,19 @@ class Ballistic1DOperation(BallisticOperation):
         velocity = ballistics_results[1]
         acceleration = ballistics_results[2]
 
-        if height < 0 and len(self.y[self.y > 0]) == 0:
+        if height < 0 and not self.has_lifted_off:
             height = 0
             velocity = 0
             acceleration = 0
+        elif height > 0:
+            self.has_lifted_off = True
 
-        self.y = np.append(self.y, height)
-        self.v = np.append(self.v, velocity)
-        self.acceleration = np.append(self.acceleration, acceleration)
-
-        self.mach_no = np.append(
-            self.mach_no,
-            self.v[-1]
-            / self.atmosphere.get_sonic_velocity(
-                self.y[-1] + self.initial_elevation_amsl
-            ),
-        )
+        self.append_history("y", height)
+        self.append_history("v", velocity)
+        self.append_history("acceleration", acceleration)
 
-        self.P_ext = np.append(
-            self.P_ext,
+        self.append_history(
+            "P_ext",
             self.atmosphere.get_pressure(
                 self.y[-1] + self.initial_elevation_amsl
             ),
@@ -3,7 +3,7 @@ from typing import Optional
 
 import numpy as np
 
-from machwave.operations import Operation
+from machwave.operations import History, Operation
 from machwave.solvers.odes import rk4th_ode_solver
 from machwave.services.equations import solve_cp_seidel
 from machwave.models.propulsion import Motor, SolidMotor
@@ -11,6 +11,7 @@ from machwave.services.isentropic_flow import (
     get_critical_pressure_ratio,
     get_exit_pressure,
     get_operational_correction_factors,
+    get_specific_impulse,
     get_thrust_coefficients,
     get_thrust_from_cf,
     is_flow_choked,
@@ -27,6 +28,15 @@ class MotorOperation(Operation):
     obtained from the simulation.
     """
 
+    t = History()  # time vector
+    V_0 = History()  # empty chamber volume
+    m_prop = History()  # propellant mass
+    P_0 = History()  # chamber stagnation pressure
+    P_exit = History()  # exit pressure
+    C_f = History()  # thrust coefficient
+    C_f_ideal = History(np.float32)  # ideal thrust coefficient
+    thrust = History()  # thrust force (N)
+
     def __init__(
         self,
         motor: Motor,
@@ -125,6 +135,15 @@ class SRMOperation(MotorOperation):
     Therefore, PEP8's snake_case will not be followed rigorously.
     """
 
+    web = History()  # instant web thickness
+    burn_area = History()
+    propellant_volume = History()
+    burn_rate = History()
+    n_kin = History(np.float32)  # kinetics correction factor
+    n_bl = History(np.float32)  # boundary layer correction factor
+    n_tp = History(np.float32)  # two-phase flow correction factor
+    n_cf = History()  # thrust coefficient correction factor
+
     def __init__(
         self,
         motor: SolidMotor,
@@ -156,6 +175,21 @@ class SRMOperation(MotorOperation):
         self.n_tp = np.array([0])  # two-phase flow correction factor
         self.n_cf = np.array([0])  # thrust coefficient correction factor
 
+        # Motor parameters that do not change during the operation, evaluated
+        # once instead of on every iteration:
+        self._throat_area = self.motor.structure.nozzle.get_throat_area()
+        self._critical_pressure_ratio = get_critical_pressure_ratio(
+            self.motor.propellant.k_mix_ch
+        )
+        self._divergent_correction_factor = (
+            self.motor.structure.nozzle.get_divergent_correction_factor()
+        )
+
+        # "Cache" variables, derived from the histories above and cleared on
+        # every iteration:
+        self._klemmung = None
+        self._grain_mass_flux = None
+
     def iterate(
         self,
         d_t: float,
@@ -170,40 +204,40 @@ class SRMOperation(MotorOperation):
             P_ext (float): The external pressure.
         """
         if not self.end_thrust:
-            self.t = np.append(
-                self.t, self.t[-1] + d_t
-            )  # append new time value
+            self._klemmung = None
+            self._grain_mass_flux = None
 
-            self.burn_area = np.append(
-                self.burn_area, self.motor.grain.get_burn_area(self.web[-1])
+            self.append_history("t", self.t[-1] + d_t)  # new time value
+
+            self.append_history(
+                "burn_area", self.motor.grain.get_burn_area(self.web[-1])
             )
-            self.propellant_volume = np.append(
-                self.propellant_volume,
+            self.append_history(
+                "propellant_volume",
                 self.motor.grain.get_propellant_volume(self.web[-1]),
             )
 
             # Calculating the free chamber volume:
-            self.V_0 = np.append(
-                self.V_0,
+            self.append_history(
+                "V_0",
                 self.motor.get_free_chamber_volume(self.propellant_volume[-1]),
             )
             # Calculating propellant mass:
-            self.m_prop = np.append(
-                self.m_prop,
+            self.append_history(
+                "m_prop",
                 self.propellant_volume[-1] * self.motor.propellant.density,
             )
 
             # Get burn rate coefficients:
-            self.burn_rate = np.append(
-                self.burn_rate,
-                self.motor.propellant.get_burn_rate(self.P_0[-1]),
+            self.append_history(
+                "burn_rate", self.motor.propellant.get_burn_rate(self.P_0[-1])
             )
 
             d_x = d_t * self.burn_rate[-1]
-            self.web = np.append(self.web, self.web[-1] + d_x)
+            self.append_history("web", self.web[-1] + d_x)
 
-            self.P_0 = np.append(
-                self.P_0,
+            self.append_history(
+                "P_0",
                 rk4th_ode_solver(
                     variables={"P0": self.P_0[-1]},
                     equation=solve_cp_seidel,
@@ -211,17 +245,18 @@ class SRMOperation(MotorOperation):
                     Pe=P_ext,
                     Ab=self.burn_area[-1],
                     V0=self.V_0[-1],
-                    At=self.motor.structure.nozzle.get_throat_area(),
+                    At=self._throat_area,
                     pp=self.motor.propellant.density,
                     k=self.motor.propellant.k_mix_ch,
                     R=self.motor.propellant.R_ch,
                     T0=self.motor.propellant.T0,
                     r=self.burn_rate[-1],
+                    critical_pressure_ratio=self._critical_pressure_ratio,
                 )[0],
             )
 
-            self.P_exit = np.append(
-                self.P_exit,
+            self.append_history(
+                "P_exit",
                 get_exit_pressure(
                     self.motor.propellant.k_2ph_ex,
                     self.motor.structure.nozzle.expansion_ratio,
@@ -239,20 +274,20 @@ class SRMOperation(MotorOperation):
                 convert_pa_to_psi(self.P_0[-1]),
                 self.motor.propellant,
                 self.motor.structure,
-                get_critical_pressure_ratio(self.motor.propellant.k_mix_ch),
+                self._critical_pressure_ratio,
                 self.V_0[0],
                 self.t[-1],
             )
 
-            self.n_kin = np.append(self.n_kin, n_kin_atual)
-            self.n_tp = np.append(self.n_tp, n_tp_atual)
-            self.n_bl = np.append(self.n_bl, n_bl_atual)
+            self.append_history("n_kin", n_kin_atual)
+            self.append_history("n_tp", n_tp_atual)
+            self.append_history("n_bl", n_bl_atual)
 
-            self.n_cf = np.append(
-                self.n_cf,
+            self.append_history(
+                "n_cf",
                 (
                     (100 - (n_kin_atual + n_bl_atual + n_tp_atual))
-                    * self.motor.structure.nozzle.get_divergent_correction_factor()
+                    * self._divergent_correction_factor
                     / 100
                     * self.motor.propellant.combustion_efficiency
                 ),
@@ -267,14 +302,14 @@ class SRMOperation(MotorOperation):
                 self.n_cf[-1],
             )
 
-            self.C_f = np.append(self.C_f, C_f_atual)
-            self.C_f_ideal = np.append(self.C_f_ideal, C_f_ideal_atual)
-            self.thrust = np.append(
-                self.thrust,
+            self.append_history("C_f", C_f_atual)
+            self.append_history("C_f_ideal", C_f_ideal_atual)
+            self.append_history(
+                "thrust",
                 get_thrust_from_cf(
                     self.C_f[-1],
                     self.P_0[-1],
-                    self.motor.structure.nozzle.get_throat_area(),
+                    self._throat_area,
                 ),
             )  # thrust calculation
 
@@ -287,7 +322,7 @@ class SRMOperation(MotorOperation):
             if not is_flow_choked(
                 self.P_0[-1],
                 P_ext,
-                get_critical_pressure_ratio(self.motor.propellant.k_mix_ch),
+                self._critical_pressure_ratio,
             ):
                 self._thrust_time = self.t[-1]
                 self.end_thrust = True
@@ -342,10 +377,12 @@ class SRMOperation(MotorOperation):
         Returns:
             np.ndarray: The klemmung values.
         """
-        return (
-            self.burn_area[self.burn_area > 0]
-            / self.motor.structure.nozzle.get_throat_area()
-        )
+        if self._klemmung is None:
+            self._klemmung = (
+                self.burn_area[self.burn_area > 0] / self._throat_area
+            )
+
+        return self._klemmung
 
     @property
     def initial_to_final_klemmung_ratio(self) -> float:
@@ -409,11 +446,14 @@ class SRMOperation(MotorOperation):
         Returns:
             np.ndarray: The grain mass flux.
         """
-        return self.motor.grain.get_mass_flux_per_segment(
-            self.burn_rate,
-            self.motor.propellant.density,
-            self.web,
-        )
+        if self._grain_mass_flux is None:
+            self._grain_mass_flux = self.motor.grain.get_mass_flux_per_segment(
+                self.burn_rate,
+                self.motor.propellant.density,
+                self.web,
+            )
+
+        return self._grain_mass_flux
 
     @property
     def total_impulse(self) -> float:
@@ -433,4 +473,4 @@ class SRMOperation(MotorOperation):
         Returns:
             float: The specific impulse.
         """
-        return self.total_impulse / self.m_prop[0] / 9.81
+        return get_specific_impulse(self.total_impulse, self.m_prop[0])
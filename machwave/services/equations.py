@@ -1,8 +1,18 @@
-from typing import Tuple
+import functools
+from typing import Optional, Tuple
 
 from machwave.services.isentropic_flow import get_critical_pressure_ratio
 
 
+@functools.lru_cache(maxsize=64)
+def _get_choked_flow_factor(k: float) -> float:
+    """
+    Returns the flow factor of Seidel's equation for choked flow, which only
+    depends on the isentropic exponent.
+    """
+    return ((k / (k + 1)) ** 0.5) * ((2 / (k + 1)) ** (1 / (k - 1)))
+
+
 def solve_cp_seidel(
     P0: float,
     Pe: float,
@@ -14,6 +24,7 @@ def solve_cp_seidel(
     R: float,
     T0: float,
     r: float,
+    critical_pressure_ratio: Optional[float] = None,
 ) -> Tuple[float]:
     """
     Calculates the chamber pressure by solving Hans Seidel's differential
@@ -34,18 +45,24 @@ def solve_cp_seidel(
         R (float): Gas constant per molecular weight.
         T0 (float): Flame temperature.
         r (float): Propellant burn rate.
+        critical_pressure_ratio (float, optional): Critical pressure ratio
+            for the isentropic exponent 'k'. Computed when not given, it can
+            be passed to avoid evaluating it on every call.
 
     Returns:
         Tuple[float]: Derivative of chamber pressure with respect to time.
 
     """
-    critical_pressure_ratio = get_critical_pressure_ratio(k_mix_ch=k)
+    if critical_pressure_ratio is None:
+        critical_pressure_ratio = get_critical_pressure_ratio(k_mix_ch=k)
+
+    pressure_ratio = Pe / P0
 
-    if Pe / P0 <= critical_pressure_ratio:
-        H = ((k / (k + 1)) ** 0.5) * ((2 / (k + 1)) ** (1 / (k - 1)))
+    if pressure_ratio <= critical_pressure_ratio:
+        H = _get_choked_flow_factor(k)
     else:
-        H = ((Pe / P0) ** (1 / k)) * (
-            ((k / (k - 1)) * (1 - (Pe / P0) ** ((k - 1) / k))) ** 0.5
+        H = (pressure_ratio ** (1 / k)) * (
+            ((k / (k - 1)) * (1 - pressure_ratio ** ((k - 1) / k))) ** 0.5
         )
 
     dP0_dt = (
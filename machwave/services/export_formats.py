@@ -34,11 +34,12 @@ def generate_eng_file_content(
     Returns:
         str: The content of the .eng file as a string.
     """
-    # Trim data to burn time
-    burn_index = np.where(time <= burn_time)[0]
-    time = time[burn_index]
-    thrust = thrust[burn_index]
-    propellant_mass = propellant_mass[burn_index]
+    # Trim data to burn time. The time array is sorted, so a binary search
+    # finds the cut and the arrays are sliced without copies:
+    burn_index = np.searchsorted(time, burn_time, side="right")
+    time = time[:burn_index]
+    thrust = thrust[:burn_index]
+    propellant_mass = propellant_mass[:burn_index]
 
     # Form a new time vector with exactly 'eng_res' points
     t_out = np.linspace(0, time[-1], eng_res)
@@ -1,8 +1,38 @@
+import math
+
 import numpy as np
-import scipy.optimize
+import scipy.constants
 
 from machwave.services.math.geometric import get_circle_area
 
+# Two-phase flow loss constants (C3, C4, C5, C6) from A015140, indexed by
+# (molecular weight regime, throat diameter bucket, C7 bucket):
+# - regime: 0 if 1 / M_ch >= 0.9, else 1;
+# - throat diameter: < 1 in, 1 to 2 in, >= 2 in;
+# - C7: < 4, 4 to 8, > 8 (only relevant for throats of 2 in or more).
+_TWO_PHASE_CONSTANTS = np.array(
+    [
+        [
+            [[9, 0.5, 1, 1]] * 3,
+            [[9, 0.5, 1, 0.8]] * 3,
+            [
+                [13.4, 0.5, 0.8, 0.8],
+                [10.2, 0.5, 0.8, 0.4],
+                [7.58, 0.5, 0.8, 0.33],
+            ],
+        ],
+        [
+            [[44.5, 1, 0.8, 0.8]] * 3,
+            [[30.4, 1, 0.8, 0.4]] * 3,
+            [
+                [44.5, 1, 0.8, 0.8],
+                [30.4, 1, 0.8, 0.4],
+                [25.2, 1, 0.8, 0.33],
+            ],
+        ],
+    ]
+)
+
 
 def get_critical_pressure_ratio(k_mix_ch: float) -> float:
     """
@@ -59,16 +89,41 @@ def get_exit_mach(k: float, E: float) -> float:
     Example:
         exit_mach = get_exit_mach(1.4, 5.0)
     """
-    exit_mach_no = scipy.optimize.fsolve(
-        lambda x: (
-            ((1 + 0.5 * (k - 1) * x**2) / (1 + 0.5 * (k - 1)))
-            ** ((k + 1) / (2 * (k - 1)))
-        )
-        / x
-        - E,
-        [10],
-    )
-    return exit_mach_no[0]
+    if E <= 1:
+        return 1.0
+
+    # Newton iterations on g(M) = ln(area ratio(M)) - ln(E), which is
+    # monotonic past M = 1. The root is kept bracketed, and a step that
+    # leaves the bracket falls back to bisection.
+    # dg/dM = (M^2 - 1) / (M * (1 + a * M^2))
+    a = 0.5 * (k - 1)
+    p = (k + 1) / (2 * (k - 1))
+    log_E = math.log(E)
+
+    def g(M: float) -> float:
+        return p * math.log((1 + a * M**2) / (1 + a)) - math.log(M) - log_E
+
+    lower, upper = 1.0, 10.0
+    while g(upper) < 0:
+        lower, upper = upper, 2 * upper
+
+    M = upper
+    for _ in range(100):
+        g_M = g(M)
+        if g_M > 0:
+            upper = M
+        else:
+            lower = M
+
+        M_new = M - g_M * M * (1 + a * M**2) / (M**2 - 1)
+        if not lower < M_new < upper:
+            M_new = 0.5 * (lower + upper)
+
+        if abs(M_new - M) <= 1e-12 * M:
+            return M_new
+        M = M_new
+
+    return M
 
 
 def get_exit_pressure(k_2ph_ex: float, E: float, P_0: float) -> float:
@@ -232,7 +287,7 @@ def get_specific_impulse(
     Example:
         specific_impulse = get_specific_impulse(15000, 100)
     """
-    return total_impulse / initial_propellant_mass / 9.81
+    return total_impulse / initial_propellant_mass / scipy.constants.g
 
 
 def get_operational_correction_factors(
@@ -278,19 +333,18 @@ def get_operational_correction_factors(
 
     # Boundary layer and two-phase flow losses
     if not is_flow_choked(P_0, P_external, critical_pressure_ratio):
+        throat_diameter_in = structure.nozzle.throat_diameter / 0.0254
+
         termc_2 = 1 + 2 * np.exp(
             -structure.nozzle.material.c_2
             * P_0_psi**0.8
             * t
-            / ((structure.nozzle.throat_diameter / 0.0254) ** 0.2)
+            / (throat_diameter_in**0.2)
         )
         E_cf = 1 + 0.016 * structure.nozzle.expansion_ratio**-9
         n_bl = (
             structure.nozzle.material.c_1
-            * (
-                (P_0_psi**0.8)
-                / ((structure.nozzle.throat_diameter / 0.0254) ** 0.2)
-            )
+            * ((P_0_psi**0.8) / (throat_diameter_in**0.2))
             * termc_2
             * E_cf
         )
@@ -306,42 +360,23 @@ def get_operational_correction_factors(
                     * (V0 / get_circle_area(structure.nozzle.throat_diameter))
                     / 0.0254
                 )
-                * (1 + 0.045 * structure.nozzle.throat_diameter / 0.0254)
+                * (1 + 0.045 * throat_diameter_in)
             )
         )
 
-        if 1 / propellant.M_ch >= 0.9:
-            C4 = 0.5
-            if structure.nozzle.throat_diameter / 0.0254 < 1:
-                C3, C5, C6 = 9, 1, 1
-            elif 1 <= structure.nozzle.throat_diameter / 0.0254 < 2:
-                C3, C5, C6 = 9, 1, 0.8
-            elif structure.nozzle.throat_diameter / 0.0254 >= 2:
-                if C7 < 4:
-                    C3, C5, C6 = 13.4, 0.8, 0.8
-                elif 4 <= C7 <= 8:
-                    C3, C5, C6 = 10.2, 0.8, 0.4
-                elif C7 > 8:
-                    C3, C5, C6 = 7.58, 0.8, 0.33
-        elif 1 / propellant.M_ch < 0.9:
-            C4 = 1
-            if structure.nozzle.throat_diameter / 0.0245 < 1:
-                C3, C5, C6 = 44.5, 0.8, 0.8
-            elif 1 <= structure.nozzle.throat_diameter / 0.0254 < 2:
-                C3, C5, C6 = 30.4, 0.8, 0.4
-            elif structure.nozzle.throat_diameter / 0.0254 >= 2:
-                if C7 < 4:
-                    C3, C5, C6 = 44.5, 0.8, 0.8
-                elif 4 <= C7 <= 8:
-                    C3, C5, C6 = 30.4, 0.8, 0.4
-                elif C7 > 8:
-                    C3, C5, C6 = 25.2, 0.8, 0.33
+        regime = int(1 / propellant.M_ch < 0.9)
+        throat_bucket = int(throat_diameter_in >= 1) + int(
+            throat_diameter_in >= 2
+        )
+        c7_bucket = int(C7 >= 4) + int(C7 > 8)
+        C3, C4, C5, C6 = _TWO_PHASE_CONSTANTS[regime, throat_bucket, c7_bucket]
+
         n_tp = C3 * (
             (propellant.qsi_ch * C4 * C7**C5)
             / (
                 P_0_psi**0.15
                 * structure.nozzle.expansion_ratio**0.08
-                * (structure.nozzle.throat_diameter / 0.0254) ** C6
+                * throat_diameter_in**C6
             )
         )
     else:
@@ -385,17 +420,15 @@ def get_expansion_ratio(
     Example:
         expansion_ratio = get_expansion_ratio([5000, 6000], [100000, 150000], 1.4, 0.5)
     """
-    E = np.zeros(np.size(P_0))
-
-    for i in range(np.size(P_0)):
-        if P_e[i] / P_0[i] <= critical_pressure_ratio:
-            pressure_ratio = P_e[i] / P_0[i]
-            E[i] = (
-                ((k + 1) / 2) ** (1 / (k - 1))
-                * pressure_ratio ** (1 / k)
-                * ((k + 1) / (k - 1) * (1 - pressure_ratio ** ((k - 1) / k)))
-                ** 0.5
-            ) ** -1
-        else:
-            E[i] = 1
+    pressure_ratio = np.asarray(P_e) / np.asarray(P_0)
+    is_supersonic = pressure_ratio <= critical_pressure_ratio
+
+    E = np.ones(np.shape(pressure_ratio))
+    pressure_ratio = pressure_ratio[is_supersonic]
+    E[is_supersonic] = (
+        ((k + 1) / 2) ** (1 / (k - 1))
+        * pressure_ratio ** (1 / k)
+        * ((k + 1) / (k - 1) * (1 - pressure_ratio ** ((k - 1) / k))) ** 0.5
+    ) ** -1
+
     return np.mean(E)
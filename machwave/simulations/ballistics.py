@@ -19,6 +19,8 @@ class BallisticSimulationParameters(SimulationParameters):
         d_t (float): Time step.
         initial_elevation_amsl (float): Initial elevation above mean sea level.
         rail_length (float): Length of the launch rail.
+        dd_t (float): Time step factor for the coast phase, after the end of
+            the thrust curve. Defaults to 1 (same time step as the burn).
     """
 
     def __init__(
@@ -30,6 +32,7 @@ class BallisticSimulationParameters(SimulationParameters):
         d_t: float,
         initial_elevation_amsl: float,
         rail_length: float,
+        dd_t: float = 1,
     ):
         self.thrust = thrust
         self.motor_dry_mass = motor_dry_mass
@@ -38,6 +41,7 @@ class BallisticSimulationParameters(SimulationParameters):
         self.d_t = d_t
         self.initial_elevation_amsl = initial_elevation_amsl
         self.rail_length = rail_length
+        self.dd_t = dd_t
 
 
 class BallisticSimulation(Simulation):
@@ -81,15 +85,9 @@ class BallisticSimulation(Simulation):
             np.ndarray: Array of propellant mass values.
         """
         initial_propellant_mass = self.params.initial_propellant_mass
-        prop_mass = np.array([])
-        time = self.params.time
+        time = np.asarray(self.params.time, dtype=float)
 
-        for t in time:
-            prop_mass = np.append(
-                prop_mass, initial_propellant_mass * (time[-1] - t) / time[-1]
-            )
-
-        return prop_mass
+        return initial_propellant_mass * (time[-1] - time) / time[-1]
 
     def run(self) -> tuple[np.array, Ballistic1DOperation]:
         """
@@ -110,16 +108,24 @@ class BallisticSimulation(Simulation):
         )
 
         propellant_mass = self.get_propellant_mass()
+        burnout_time = self.params.time[-1]
 
+        # The time values are gathered in a list and converted once, instead
+        # of copying the whole array on every step:
+        time = [0.0]
         i = 0
 
         while self.ballistic_operation.y[i] >= 0:
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
+            d_t = self.params.d_t
+
+            if time[i] >= burnout_time:
+                # Coast phase, no thrust nor propellant mass left:
+                d_t = self.params.d_t * self.params.dd_t
+
+            time.append(time[i] + d_t)  # new time value
 
             thrust = np.interp(
-                self.t[-1],
+                time[-1],
                 self.params.time,
                 self.params.thrust,
                 left=0,
@@ -128,18 +134,20 @@ class BallisticSimulation(Simulation):
 
             self.ballistic_operation.iterate(
                 np.interp(
-                    self.t[-1],
+                    time[-1],
                     self.params.time,
                     propellant_mass,
                     left=0,
                     right=0,
                 ),  # interpolating propellant mass with new time value
                 thrust,
-                self.params.d_t,
+                d_t,
             )
 
             i += 1
 
+        self.t = np.array(time)
+
         return (self.t, self.ballistic_operation)
 
     def print_results(self):
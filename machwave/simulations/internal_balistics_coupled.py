@@ -116,15 +116,16 @@ class InternalBallisticsCoupled(Simulation):
             initial_elevation_amsl=self.params.initial_elevation_amsl,
         )
 
+        # The time values are gathered in a list and converted once, instead
+        # of copying the whole array on every step:
+        time = [0.0]
         i = 0
 
         while (
             self.ballistic_operation.y[i] >= 0
             or self.motor_operation.m_prop[-1] > 0
         ):
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
+            time.append(time[i] + self.params.d_t)  # new time value
 
             if self.motor_operation.end_thrust is False:
                 self.motor_operation.iterate(
@@ -141,12 +142,14 @@ class InternalBallisticsCoupled(Simulation):
 
                 # Adding new delta time value for ballistic simulation:
                 d_t = self.params.d_t * self.params.dd_t
-                self.t[-1] = self.t[-2] + self.params.dd_t * self.params.d_t
+                time[-1] = time[-2] + self.params.dd_t * self.params.d_t
 
             self.ballistic_operation.iterate(propellant_mass, thrust, d_t)
 
             i += 1
 
+        self.t = np.array(time)
+
         return (self.motor_operation, self.ballistic_operation)
 
     def print_results(self):
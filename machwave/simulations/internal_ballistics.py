@@ -81,12 +81,13 @@ class InternalBallistics(Simulation):
         """
         self.motor_operation = self.get_motor_operation()
 
+        # The time values are gathered in a list and converted once, instead
+        # of copying the whole array on every step:
+        time = [0.0]
         i = 0
 
         while not self.motor_operation.end_thrust:
-            self.t = np.append(
-                self.t, self.t[i] + self.params.d_t
-            )  # new time value
+            time.append(time[i] + self.params.d_t)  # new time value
 
             self.motor_operation.iterate(
                 self.params.d_t,
@@ -95,6 +96,8 @@ class InternalBallistics(Simulation):
 
             i += 1
 
+        self.t = np.array(time)
+
         return (self.t, self.motor_operation)
 
     def print_results(self):
@@ -1,5 +1,7 @@
+import copy
 from typing import Callable
 
+from fluids.atmosphere import ATMOSPHERE_1976
 import numpy as np
 from numpy import testing as np_testing
 import pytest
@@ -106,3 +108,56 @@ def test_get_wind_velocity_negative_altitude(atmosphere1976withwindpowerlaw):
         [expected_northward, expected_eastward],
         decimal=5,
     )
+
+
+def test_atmosphere1976_array_lookup():
+    """
+    Test that array queries match scalar queries and the exact model, also
+    outside of the tabulated altitude range.
+    """
+    atmosphere1976 = Atmosphere1976()
+    heights = np.array([-2e3, 0, 1234.5, 11e3, 47e3, 85e3, 150e3])
+
+    densities = atmosphere1976.get_density(heights)
+    pressures = atmosphere1976.get_pressure(heights)
+
+    np_testing.assert_allclose(
+        densities, [atmosphere1976.get_density(h) for h in heights]
+    )
+    np_testing.assert_allclose(
+        densities, [ATMOSPHERE_1976(h).rho for h in heights], rtol=1e-4
+    )
+    np_testing.assert_allclose(
+        pressures, [ATMOSPHERE_1976(h).P for h in heights], rtol=1e-4
+    )
+
+
+def test_atmosphere1976_tables_are_shared():
+    """
+    Test that the tables are built once and not copied with the instances.
+    """
+    atmosphere1976 = Atmosphere1976()
+    atmosphere1976_copy = copy.deepcopy(atmosphere1976)
+
+    assert atmosphere1976_copy.get_tables() is atmosphere1976.get_tables()
+    assert vars(atmosphere1976_copy) == {}
+    assert not atmosphere1976.get_tables()["rho"].flags.writeable
+
+
+def test_atmosphere1976_scalar_lookup():
+    """
+    Test that scalar queries return floats matching np.interp on the tables,
+    including at the edges of the tabulated altitude range.
+    """
+    atmosphere1976 = Atmosphere1976()
+    tables = atmosphere1976.get_tables()
+    heights = [-1e3, -999.5, 0, 1234.5, 11e3, 99995.0, 100e3]
+
+    for height in heights:
+        density = atmosphere1976.get_density(height)
+        assert isinstance(density, float)
+        np_testing.assert_allclose(
+            density,
+            np.interp(height, tables["altitude"], tables["rho"]),
+            rtol=1e-12,
+        )
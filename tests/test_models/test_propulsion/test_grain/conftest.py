@@ -1,7 +1,10 @@
+from typing import Callable
+
 import pytest
 
 from machwave.models.propulsion.grain import Grain
 from machwave.models.propulsion.grain.geometries.bates import BatesSegment
+from machwave.models.propulsion.grain.geometries.star import StarGrainSegment
 
 """
 Olympus fixtures are based on the 2022 version of the motor.
@@ -42,3 +45,29 @@ def bates_grain_olympus(bates_segment_olympus_45, bates_segment_olympus_60):
     grain.add_segment(bates_segment_olympus_60)
 
     return grain
+
+
+@pytest.fixture
+def star_grain_segment_factory() -> Callable[..., StarGrainSegment]:
+    """
+    Returns a function that builds a new star grain segment, with 5 points by
+    default. FMM segments cache their maps, so every call returns a new
+    instance.
+    """
+
+    def make_star_grain_segment(number_of_points: int = 5) -> StarGrainSegment:
+        return StarGrainSegment(
+            outer_diameter=41e-3,
+            length=0.5,
+            number_of_points=number_of_points,
+            point_length=15e-3,
+            point_width=10e-3,
+            spacing=10e-3,
+        )
+
+    return make_star_grain_segment
+
+
+@pytest.fixture
+def star_grain_segment(star_grain_segment_factory):
+    return star_grain_segment_factory()
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from machwave.models.propulsion.grain import GrainGeometryError
+
+
+def test_fmm_segments_share_read_only_maps(star_grain_segment_factory):
+    segments = [
+        star_grain_segment_factory(number_of_points)
+        for number_of_points in [4, 5]
+    ]
+    maps_a, maps_b = (segment.get_maps() for segment in segments)
+
+    for map_a, map_b in zip(maps_a, maps_b):
+        assert map_a is map_b
+        assert not map_a.flags.writeable
+
+
+def test_fmm_segment_map_dim_validation(star_grain_segment):
+    segment = star_grain_segment
+
+    for map_dim in [50, 10_000, 1000.0]:
+        segment.map_dim = map_dim
+        with pytest.raises(GrainGeometryError):
+            segment.validate()
+
+    segment.map_dim = np.int64(500)
+    segment.validate()
+
+
+def test_fmm_2d_face_area_accepts_arrays(star_grain_segment):
+    segment = star_grain_segment
+    web_distance = np.linspace(0, segment.get_web_thickness(), 20)
+
+    face_area = segment.get_face_area(web_distance)
+    port_area = segment.get_port_area(web_distance)
+
+    np.testing.assert_allclose(
+        face_area, [segment.get_face_area(web) for web in web_distance]
+    )
+    np.testing.assert_allclose(
+        port_area, [segment.get_port_area(web) for web in web_distance]
+    )
+    # The face area can only decrease as the grain burns:
+    assert np.all(np.diff(face_area) < 1e-6)
+
+
+def test_fmm_count_unburnt_cells(star_grain_segment, monkeypatch):
+    segment = star_grain_segment
+    regression_values = segment.get_sorted_regression_values()
+    assert regression_values.dtype == np.float32
+
+    # The sorted values are searched without being cast:
+    searchsorted = np.searchsorted
+
+    def searchsorted_same_dtype(values, needle, *args, **kwargs):
+        assert np.asarray(needle).dtype == values.dtype
+        return searchsorted(values, needle, *args, **kwargs)
+
+    monkeypatch.setattr(np, "searchsorted", searchsorted_same_dtype)
+
+    # Web distances at, just below and just above some of the regression
+    # values, all in double precision:
+    values = regression_values[:: regression_values.size // 7].astype(
+        np.float64
+    )
+    web_distance = np.concatenate(
+        [
+            values,
+            np.nextafter(values, -np.inf),
+            np.nextafter(values, np.inf),
+            [0.0, 0.3, 2.0],
+        ]
+    )
+    expected = [
+        np.count_nonzero(regression_values.astype(np.float64) > web)
+        for web in web_distance
+    ]
+
+    np.testing.assert_array_equal(
+        segment.count_unburnt_cells(web_distance), expected
+    )
+    for web, expected_count in zip(web_distance, expected):
+        assert segment.count_unburnt_cells(web) == expected_count
+        assert np.ndim(segment.count_unburnt_cells(web)) == 0
+
+    # Single precision web distances are searched as they are:
+    np.testing.assert_array_equal(
+        segment.count_unburnt_cells(values.astype(np.float32)),
+        [np.count_nonzero(regression_values > web) for web in values],
+    )
+
+
+def test_fmm_2d_results_are_double_precision(star_grain_segment):
+    segment = star_grain_segment
+    assert segment.get_regression_map().dtype == np.float32
+
+    web_thickness = segment.get_web_thickness()
+    assert isinstance(web_thickness, float)
+
+    face_area_interp_func = segment.get_face_area_interp_func()
+    assert face_area_interp_func.x.dtype == np.float64
+    assert face_area_interp_func.y.dtype == np.float64
+    assert segment.get_face_area(0.5 * web_thickness).dtype == np.float64
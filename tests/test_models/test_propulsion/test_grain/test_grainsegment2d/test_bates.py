@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from machwave.models.propulsion.grain.geometries import BatesSegment
@@ -66,3 +67,59 @@ def test_olympus_grain_segment_count(bates_grain_olympus):
     assert bates_grain_olympus.segment_count == len(
         bates_grain_olympus.segments
     )
+
+
+def test_olympus_grain_mass_flux_per_segment(bates_grain_olympus):
+    grain = bates_grain_olympus
+    propellant_density = 1700
+    web_distance = np.linspace(0, 20e-3, 50)
+    burn_rate = np.linspace(1e-3, 5e-3, 50)
+
+    mass_flux = grain.get_mass_flux_per_segment(
+        burn_rate, propellant_density, web_distance
+    )
+
+    assert mass_flux.shape == (grain.segment_count, np.size(web_distance))
+    assert mass_flux.dtype == np.float32
+    assert mass_flux.flags.c_contiguous
+
+    mass_flux_64 = grain.get_mass_flux_per_segment(
+        burn_rate, propellant_density, web_distance, dtype=np.float64
+    )
+    assert mass_flux_64.dtype == np.float64
+    np.testing.assert_allclose(mass_flux, mass_flux_64, rtol=1e-6)
+
+    # The last segment carries the mass flow generated by the whole grain:
+    last_segment = grain.segments[-1]
+    for i, web in enumerate(web_distance):
+        expected_value = (
+            grain.get_burn_area(web)
+            * propellant_density
+            * burn_rate[i]
+            / last_segment.get_port_area(web)
+        )
+        assert mass_flux[-1, i] == pytest.approx(expected_value)
+
+
+def test_bates_segment_burn_area_and_volume_arrays(bates_segment_olympus_45):
+    segment = bates_segment_olympus_45
+    web_thickness = segment.get_web_thickness()
+    web_distance = np.linspace(0, 1.2 * web_thickness, 25)
+
+    burn_area = segment.get_burn_area(web_distance)
+    volume = segment.get_volume(web_distance)
+
+    for i, web in enumerate(web_distance):
+        assert burn_area[i] == pytest.approx(segment.get_burn_area(web))
+        assert volume[i] == pytest.approx(segment.get_volume(web))
+
+    # Nothing is left after the web thickness is consumed:
+    assert np.all(burn_area[web_distance > web_thickness] == 0)
+    assert np.all(volume[web_distance > web_thickness] == 0)
+    assert segment.get_burn_area(web_thickness * 1.01) == 0
+
+
+    # Scalars skip the array evaluation:
+    assert not isinstance(segment.get_burn_area(0.01), np.ndarray)
+    assert not isinstance(segment.get_volume(0.01), np.ndarray)
+    assert np.ndim(segment.get_burn_area(np.array(0.01))) == 0
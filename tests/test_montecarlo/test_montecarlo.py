@@ -0,0 +1,224 @@
+import numpy as np
+import pytest
+
+from machwave.models.atmosphere.atm_1976 import (
+    Atmosphere1976,
+    _tabulate_atmosphere_1976,
+)
+from machwave.models.propulsion.grain import Grain
+from machwave.models.propulsion.grain.geometries import StarGrainSegment
+from machwave.montecarlo import (
+    MonteCarloParameter,
+    MonteCarloSimulation,
+    OperationSummary,
+    _warm_up_worker,
+)
+from machwave.operations import Operation
+from machwave.simulations import Simulation
+
+
+class SquareOperation(Operation):
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def iterate(self) -> None:
+        pass
+
+    def print_results(self) -> None:
+        pass
+
+
+class SquareSimulation(Simulation):
+    def run(self) -> list[Operation]:
+        return [SquareOperation(self.params**2)]
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_montecarlo_simulation_run_in_parallel():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+    number_of_scenarios = 20
+
+    np.random.seed(42)
+    sequential = MonteCarloSimulation(
+        [parameter], number_of_scenarios, SquareSimulation
+    )
+    sequential.run()
+
+    np.random.seed(42)
+    parallel = MonteCarloSimulation(
+        [parameter], number_of_scenarios, SquareSimulation
+    )
+    parallel.run(max_workers=2)
+
+    expected = np.array(sequential.scenarios)[:, 0] ** 2
+    np.testing.assert_allclose(
+        sequential.retrieve_values_from_result(0, "value"), expected
+    )
+    np.testing.assert_allclose(
+        parallel.retrieve_values_from_result(0, "value"), expected
+    )
+
+
+def test_montecarlo_warm_up_builds_shared_caches():
+    atmosphere = Atmosphere1976()
+    segment = StarGrainSegment(
+        outer_diameter=41e-3,
+        length=0.5,
+        number_of_points=5,
+        point_length=15e-3,
+        point_width=10e-3,
+        spacing=10e-3,
+    )
+    grain = Grain()
+    grain.add_segment(segment)
+    _tabulate_atmosphere_1976.cache_clear()
+
+    _warm_up_worker([NestedParameters(atmosphere, [grain]), 1.0])
+
+    assert _tabulate_atmosphere_1976.cache_info().currsize == 1
+    assert segment.maps is not None
+    # Only the caches are built, not the scenario's results:
+    assert segment.regression_map is None
+
+
+def test_montecarlo_simulation_run_in_parallel_with_few_scenarios():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+
+    empty = MonteCarloSimulation([parameter], 0, SquareSimulation)
+    empty.run(max_workers=2)
+    assert empty.results == []
+
+    single = MonteCarloSimulation([parameter], 1, SquareSimulation)
+    single.run(max_workers=2)
+    assert len(single.results) == 1
+
+
+class NestedParameters:
+    def __init__(self, first: float, second: float) -> None:
+        self.first = first
+        self.second = second
+
+
+class NestedSimulation(Simulation):
+    def run(self) -> list[Operation]:
+        return [SquareOperation(self.params.first * self.params.second)]
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_montecarlo_simulation_draws_parameters_in_batch():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+    nested = NestedParameters(parameter, parameter)
+    number_of_scenarios = 5
+
+    np.random.seed(42)
+    expected = parameter.sample(2 * number_of_scenarios).reshape(
+        number_of_scenarios, 2
+    )
+
+    np.random.seed(42)
+    simulation = MonteCarloSimulation(
+        [nested], number_of_scenarios, NestedSimulation
+    )
+    simulation.run()
+
+    np.testing.assert_allclose(
+        [
+            [scenario[0].first, scenario[0].second]
+            for scenario in simulation.scenarios
+        ],
+        expected,
+    )
+    np.testing.assert_allclose(
+        simulation.retrieve_values_from_result(0, "value"),
+        expected[:, 0] * expected[:, 1],
+    )
+    # The original object keeps its MonteCarloParameter instances:
+    assert nested.first is parameter
+
+
+class SquareAndRootSimulation(Simulation):
+    def run(self) -> list[Operation]:
+        root = SquareOperation(self.params**0.5)
+        root.root_only = True
+        return [SquareOperation(self.params**2), root]
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_montecarlo_simulation_keeps_only_requested_properties():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+    simulation = MonteCarloSimulation([parameter], 4, SquareAndRootSimulation)
+    simulation.run(properties=["value", "root_only"])
+
+    for result in simulation.results:
+        assert isinstance(result[0], OperationSummary)
+        assert not hasattr(result[0], "root_only")
+        assert result[1].root_only
+
+    np.testing.assert_allclose(
+        simulation.retrieve_values_from_result(0, "value"),
+        np.array(simulation.scenarios)[:, 0] ** 2,
+    )
+
+
+class SquareArraySimulation(Simulation):
+    def run(self) -> list[Operation]:
+        operation = SquareOperation(self.params**2)
+        operation.history = np.array([self.params, self.params**2])
+        operation.label = f"{self.params:.2f}"
+        return [operation]
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_montecarlo_simulation_retrieves_non_scalar_values():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+    simulation = MonteCarloSimulation([parameter], 3, SquareArraySimulation)
+    simulation.run()
+
+    params = np.array(simulation.scenarios)[:, 0]
+    values = simulation.retrieve_values_from_result(0, "value")
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, params**2)
+
+    np.testing.assert_allclose(
+        simulation.retrieve_values_from_result(0, "history"),
+        np.stack([params, params**2], axis=1),
+    )
+    np.testing.assert_array_equal(
+        simulation.retrieve_values_from_result(0, "label"),
+        [f"{param:.2f}" for param in params],
+    )
+
+
+def test_montecarlo_simulation_rejects_undefined_properties():
+    parameter = MonteCarloParameter(value=10, tolerance=3)
+    simulation = MonteCarloSimulation([parameter], 2, SquareSimulation)
+
+    with pytest.raises(ValueError, match="missing_property"):
+        simulation.run(properties=["value", "missing_property"])
+
+
+def test_montecarlo_scenario_replaces_parameters_in_lists():
+    first = NestedParameters(MonteCarloParameter(value=1, tolerance=0.3), 2)
+    second = NestedParameters(MonteCarloParameter(value=3, tolerance=0.3), 4)
+    container = NestedParameters([first, second, first], 5)
+
+    simulation = MonteCarloSimulation([container], 1, NestedSimulation)
+    (scenario_container,) = simulation.generate_scenario()
+
+    # Every item of the list is searched, and shared references are kept:
+    copied_first, copied_second, copied_first_again = scenario_container.first
+    assert copied_first is copied_first_again
+    assert isinstance(copied_first.first, float)
+    assert isinstance(copied_second.first, float)
+    assert len(simulation.get_parameter_paths()) == 2
+
+    # The input parameters are not modified:
+    assert isinstance(first.first, MonteCarloParameter)
@@ -0,0 +1,77 @@
+import pickle
+from copy import deepcopy
+
+import numpy as np
+
+from machwave.operations import History, Operation
+
+
+class CounterOperation(Operation):
+    values = History()
+    halves = History(np.float32)
+
+    def __init__(self) -> None:
+        self.values = np.array([0])
+        self.halves = np.array([0])
+
+    def iterate(self) -> None:
+        self.append_history("values", self.values[-1] + 1)
+        self.append_history("halves", self.values[-1] / 2)
+
+    def print_results(self) -> None:
+        pass
+
+
+def test_history_append():
+    operation = CounterOperation()
+
+    for _ in range(100):
+        operation.iterate()
+
+    assert isinstance(operation.values, np.ndarray)
+    np.testing.assert_array_equal(operation.values, np.arange(101))
+
+    # Assigning replaces the history:
+    operation.values = [5, 6]
+    operation.iterate()
+    np.testing.assert_array_equal(operation.values, [5, 6, 7])
+
+
+def test_history_copies_are_independent():
+    operation = CounterOperation()
+    for _ in range(20):
+        operation.iterate()
+
+    for copy in (deepcopy(operation), pickle.loads(pickle.dumps(operation))):
+        copy.values[-1] = -1
+        copy.iterate()
+
+        np.testing.assert_array_equal(copy.values[-2:], [-1, 0])
+        np.testing.assert_array_equal(operation.values, np.arange(21))
+
+
+def test_history_dtype():
+    operation = CounterOperation()
+    for _ in range(50):
+        operation.iterate()
+
+    assert operation.values.dtype == np.float64
+    assert operation.halves.dtype == np.float32
+    np.testing.assert_array_equal(operation.halves, np.arange(51) / 2)
+
+
+def test_history_buffers_are_not_pickled():
+    operation = CounterOperation()
+    for _ in range(1000):
+        operation.iterate()
+
+    state = operation.__getstate__()
+    assert "_values_buffer" not in state
+    assert "_halves_buffer" not in state
+
+    copy = pickle.loads(pickle.dumps(operation))
+    payload = operation.values.nbytes + operation.halves.nbytes
+    assert len(pickle.dumps(operation)) < 1.1 * payload
+
+    copy.iterate()
+    np.testing.assert_array_equal(copy.values, np.arange(1002))
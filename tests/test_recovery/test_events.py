@@ -53,3 +53,34 @@ def test_recovery_get_drag_coefficient_and_area():
         + event2.parachute.drag_coefficient
     )
     assert area == event1.parachute.area + event2.parachute.area
+
+
+def test_apogee_based_event_tracks_apogee_incrementally():
+    event = ApogeeBasedEvent(1, HemisphericalParachute(2))
+
+    time = np.arange(8.0)
+    height = np.array([0, 5, 9, 10, 10, 8, 3, 0])
+    velocity = np.array([5, 4, 1, 0, 0, -2, -5, -3])
+
+    activity = [
+        event.is_active(height[:i], time[:i], velocity[:i], 0)
+        for i in range(1, 9)
+    ]
+
+    assert event.get_apogee_index(height) == 3
+    assert activity == [False, False, False, False, False, True, True, True]
+
+    # The apogee of the previous flight is cleared on reset:
+    event.reset()
+    assert event.get_apogee_index(np.array([0, 2, 1])) == 1
+
+
+def test_recovery_reset_clears_tracked_apogee():
+    recovery = Recovery()
+    event = ApogeeBasedEvent(1, HemisphericalParachute(2))
+    recovery.add_event(event)
+
+    assert event.get_apogee_index(np.array([0, 5, 9, 10, 8])) == 3
+
+    recovery.reset()
+    assert event.get_apogee_index(np.array([0, 7, 6])) == 1
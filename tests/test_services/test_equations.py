@@ -0,0 +1,41 @@
+from pytest import approx, mark
+
+from machwave.services.equations import solve_cp_seidel
+from machwave.services.isentropic_flow import get_critical_pressure_ratio
+
+K = 1.13
+CHAMBER_KWARGS = dict(
+    P0=5e6,
+    Ab=0.3,
+    V0=1e-3,
+    At=1e-3,
+    pp=1700,
+    k=K,
+    R=200,
+    T0=1600,
+    r=5e-3,
+)
+
+
+@mark.parametrize("Pe", [1e5, 4e6])  # choked and subsonic nozzle flow
+def test_solve_cp_seidel_precomputed_critical_pressure_ratio(Pe):
+    (dP0_dt,) = solve_cp_seidel(Pe=Pe, **CHAMBER_KWARGS)
+    (dP0_dt_precomputed,) = solve_cp_seidel(
+        Pe=Pe,
+        **CHAMBER_KWARGS,
+        critical_pressure_ratio=get_critical_pressure_ratio(K),
+    )
+
+    assert dP0_dt_precomputed == dP0_dt
+
+
+def test_solve_cp_seidel_choked_flow():
+    (dP0_dt,) = solve_cp_seidel(Pe=1e5, **CHAMBER_KWARGS)
+
+    H = (K / (K + 1)) ** 0.5 * (2 / (K + 1)) ** (1 / (K - 1))
+    expected = (
+        200 * 1600 * 0.3 * 1700 * 5e-3
+        - 5e6 * 1e-3 * H * (2 * 200 * 1600) ** 0.5
+    ) / 1e-3
+
+    assert dP0_dt == approx(expected)
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import numpy as np
 
 from pytest import approx, mark
@@ -42,6 +44,18 @@ def test_get_exit_mach():
     assert exit_mach == approx(3.677229)
 
 
+@mark.parametrize("k", [1.1, 1.2, 1.4])
+@mark.parametrize("expansion_ratio", [1.01, 2, 8, 50, 300])
+def test_get_exit_mach_inverts_area_ratio(k, expansion_ratio):
+    M = get_exit_mach(k, expansion_ratio)
+    area_ratio = ((1 + 0.5 * (k - 1) * M**2) / (1 + 0.5 * (k - 1))) ** (
+        (k + 1) / (2 * (k - 1))
+    ) / M
+
+    assert M > 1
+    assert area_ratio == approx(expansion_ratio, rel=1e-10)
+
+
 def test_get_exit_pressure():
     k_2ph_ex = 1.4
     E = 8
@@ -109,6 +123,42 @@ def test_get_specific_impulse():
     assert specific_impulse == approx(2.542, rel=1e-2)
 
 
+@mark.parametrize(
+    "throat_diameter, M_ch, V0, expected_n_tp",
+    [
+        (0.03, 1.2, 1e-3, 1.363047),  # 1 to 2 in throat
+        (0.06, 1.0, 1e-1, 0.706942),  # over 2 in throat, C7 < 4
+    ],
+)
+def test_get_operational_correction_factors(
+    throat_diameter, M_ch, V0, expected_n_tp
+):
+    propellant = SimpleNamespace(
+        Isp_frozen=200, Isp_shifting=210, qsi_ch=0.3, M_ch=M_ch
+    )
+    structure = SimpleNamespace(
+        nozzle=SimpleNamespace(
+            material=SimpleNamespace(c_1=0.00506, c_2=0),
+            throat_diameter=throat_diameter,
+            expansion_ratio=8,
+        )
+    )
+
+    n_kin, n_tp, n_bl = get_operational_correction_factors(
+        1e5, 1e5, 800, propellant, structure, 0.528, V0, 1.0
+    )
+    assert n_kin == approx(33.3 * 200 * (200 / 210) / 800)
+    assert n_tp == approx(expected_n_tp, rel=1e-5)
+    assert n_bl > 0
+
+    # No two-phase or boundary layer losses computed for choked flow:
+    _, n_tp, n_bl = get_operational_correction_factors(
+        1e6, 1e5, 800, propellant, structure, 0.528, V0, 1.0
+    )
+    assert n_tp == 0
+    assert n_bl == 0
+
+
 def test_get_divergent_correction_factor():
     divergent_angle = 15
     correction_factor = get_divergent_correction_factor(divergent_angle)